@@ -1,19 +1,45 @@
 """FastAPI application for post-automation API."""
 
-from datetime import datetime
+import asyncio
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 
 from post_automation.api.routes import detection, health, modification
+from post_automation.core.ai_detector import get_detector
+from post_automation.core.batcher import close_batcher
 from post_automation.models.api_schemas import ErrorResponse
 from post_automation.utils.config import get_settings
 from post_automation.utils.logger import setup_logger
+from post_automation.utils.timestamps import utc_timestamp
 
 logger = setup_logger(__name__)
 settings = get_settings()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Load the AI detector on startup so requests never pay for model loading."""
+    logger.info("Starting Post Automation API")
+    logger.info(f"API Host: {settings.api_host}:{settings.api_port}")
+    logger.info(f"CORS Origins: {settings.cors_origins_list}")
+
+    try:
+        detector = await asyncio.to_thread(get_detector)
+        await asyncio.to_thread(detector.warmup)
+        logger.info("AI detector loaded and warmed up")
+    except Exception as e:
+        # Keep serving; detection endpoints will retry loading on demand
+        logger.error(f"Failed to preload AI detector: {e}")
+
+    yield
+
+    logger.info("Shutting down Post Automation API")
+    await close_batcher()
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Post Automation API",
@@ -21,6 +47,8 @@ app = FastAPI(
     version="0.1.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # Add CORS middleware for n8n integration
@@ -44,32 +72,16 @@ async def global_exception_handler(request, exc: Exception):
     """Handle all unhandled exceptions."""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         content=ErrorResponse(
             detail=str(exc),
             error_type=type(exc).__name__,
-            timestamp=datetime.utcnow().isoformat() + "Z",
-        ).dict(),
+            timestamp=utc_timestamp(),
+        ).model_dump(),
     )
 
 
-# Startup event
-@app.on_event("startup")
-async def startup_event():
-    """Run on application startup."""
-    logger.info("Starting Post Automation API")
-    logger.info(f"API Host: {settings.api_host}:{settings.api_port}")
-    logger.info(f"CORS Origins: {settings.cors_origins_list}")
-
-
-# Shutdown event
-@app.on_event("shutdown")
-async def shutdown_event():
-    """Run on application shutdown."""
-    logger.info("Shutting down Post Automation API")
-
-
 # Root endpoint
 @app.get("/")
 async def root():
@@ -1,13 +1,16 @@
 """AI detection endpoints."""
 
+import asyncio
+
 from fastapi import APIRouter, File, HTTPException, UploadFile, status
 
 from post_automation.core.ai_detector import get_detector
+from post_automation.core.batcher import get_batcher
 from post_automation.core.ppt_analyzer import PPTAnalyzer
 from post_automation.models.api_schemas import TextDetectionRequest
 from post_automation.models.detection import DetectionResult
 from post_automation.models.ppt import PresentationDetection, SlideDetection
-from post_automation.utils.file_handler import cleanup_file, save_uploaded_file
+from post_automation.utils.file_handler import cleanup_file, save_upload_stream
 from post_automation.utils.logger import setup_logger
 from post_automation.utils.validators import ValidationError, validate_pptx_file, validate_text_input
 
@@ -31,11 +34,11 @@ async def detect_text(request: TextDetectionRequest):
         # Validate input
         validate_text_input(request.text)
 
-        # Get detector
-        detector = get_detector(request.model)
+        # Get detector (may load the model on first use)
+        detector = await asyncio.to_thread(get_detector, request.model)
 
-        # Run detection
-        result = detector.detect(request.text)
+        # Run detection, batched together with other concurrent requests
+        result = await get_batcher(detector).submit(request.text)
 
         logger.info(f"Text detection complete: {result.label} ({result.confidence:.2f})")
 
@@ -62,52 +65,37 @@ async def detect_pptx(file: UploadFile = File(...)):
     temp_path = None
 
     try:
-        # Read file content
-        file_content = await file.read()
-
-        # Validate file
-        validate_pptx_file(file.filename or "unknown.pptx", len(file_content))
+        # Validate file before touching disk (size is unknown for chunked uploads)
+        validate_pptx_file(file.filename or "unknown.pptx", file.size)
 
-        # Save to temporary location
-        temp_path = save_uploaded_file(file_content, file.filename or "upload.pptx")
+        # Stream upload to a temporary file, aborting once it exceeds the size limit
+        temp_path, _ = await save_upload_stream(file, file.filename or "upload.pptx")
 
         # Extract text from slides
         analyzer = PPTAnalyzer()
-        slides_text = analyzer.extract_text_from_pptx(temp_path)
+        slides_text = await asyncio.to_thread(analyzer.extract_text_fast, temp_path)
+
+        # Detect AI content in all slides with a single batched forward pass.
+        # Empty slides are skipped by the detector and reported as human.
+        detector = await asyncio.to_thread(get_detector)
+        detections = await asyncio.to_thread(
+            detector.detect_batch, [slide_text.text for slide_text in slides_text]
+        )
 
-        # Detect AI content in each slide
-        detector = get_detector()
         slide_detections = []
         ai_count = 0
 
-        for slide_text in slides_text:
-            if slide_text.text.strip():
-                detection = detector.detect(slide_text.text)
-
-                slide_detections.append(
-                    SlideDetection(
-                        slide_number=slide_text.slide_number,
-                        text=slide_text.text,
-                        detection=detection,
-                    )
+        for slide_text, detection in zip(slides_text, detections):
+            slide_detections.append(
+                SlideDetection(
+                    slide_number=slide_text.slide_number,
+                    text=slide_text.text if slide_text.text.strip() else "",
+                    detection=detection,
                 )
+            )
 
-                if detection.is_ai_generated:
-                    ai_count += 1
-            else:
-                # Empty slide - mark as human (no AI detection)
-                slide_detections.append(
-                    SlideDetection(
-                        slide_number=slide_text.slide_number,
-                        text="",
-                        detection=DetectionResult(
-                            is_ai_generated=False,
-                            confidence=0.0,
-                            label="Human",
-                            model_name=detector.model_name,
-                        ),
-                    )
-                )
+            if detection.is_ai_generated:
+                ai_count += 1
 
         # Build response
         result = PresentationDetection(
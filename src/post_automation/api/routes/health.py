@@ -1,11 +1,11 @@
 """Health check endpoint."""
 
-from datetime import datetime
-
 from fastapi import APIRouter
 
+from post_automation.core.ai_detector import is_detector_loaded
 from post_automation.models.api_schemas import HealthResponse
 from post_automation.utils.logger import setup_logger
+from post_automation.utils.timestamps import cached_utc_timestamp
 
 logger = setup_logger(__name__)
 
@@ -20,23 +20,15 @@ async def health_check():
     Returns:
         Health status of the service.
     """
-    # Check if AI models can be loaded (lightweight check)
-    models_ok = True
-    try:
-        from post_automation.core.ai_detector import get_detector
-
-        # Note: This will load the model on first call
-        # Consider adding a flag to skip model loading for health checks
-        logger.info("Health check: AI detector accessible")
-    except Exception as e:
-        logger.error(f"Health check failed: {e}")
-        models_ok = False
+    # Only report whether the detector is loaded; never trigger a model load here
+    models_ok = is_detector_loaded()
+    logger.debug(f"Health check: detector loaded={models_ok}")
 
     status_val = "healthy" if models_ok else "degraded"
 
     return HealthResponse(
         status=status_val,
-        timestamp=datetime.utcnow().isoformat() + "Z",
+        timestamp=cached_utc_timestamp(),
         version="0.1.0",
         models_loaded=models_ok,
     )
@@ -1,14 +1,24 @@
 """PowerPoint modification endpoint."""
 
+import asyncio
+import os
+from typing import Optional
+
 from fastapi import APIRouter, File, Form, HTTPException, UploadFile, status
 from fastapi.responses import FileResponse
+from starlette.background import BackgroundTask
 
 from post_automation.core.ai_detector import get_detector
 from post_automation.core.content_generator import ContentGenerator
 from post_automation.core.ppt_analyzer import PPTAnalyzer
 from post_automation.core.ppt_modifier import PPTModifier
-from post_automation.models.ppt import ColorScheme, Replacement, StyleConfig
-from post_automation.utils.file_handler import cleanup_file, generate_temp_filename, save_uploaded_file
+from post_automation.models.ppt import ReplacementT, StyleConfigT
+from post_automation.utils.file_handler import (
+    cleanup_dir,
+    create_request_dir,
+    generate_temp_filename,
+    save_upload_stream,
+)
 from post_automation.utils.logger import setup_logger
 from post_automation.utils.validators import ValidationError, validate_pptx_file
 
@@ -42,94 +52,128 @@ async def modify_pptx(
     Returns:
         Modified PowerPoint file.
     """
-    temp_input = None
-    temp_output = None
+    # Input and output files share one directory, removed as a whole at the end
+    request_dir = create_request_dir()
 
     try:
-        # Read and validate file
-        file_content = await file.read()
-        validate_pptx_file(file.filename or "unknown.pptx", len(file_content))
-
-        # Save uploaded file
-        temp_input = save_uploaded_file(file_content, file.filename or "upload.pptx")
-
-        # Initialize components
-        analyzer = PPTAnalyzer()
-        modifier = PPTModifier(temp_input)
-
-        # Step 1: Replace AI content if requested
-        if replace_ai_content:
-            logger.info("Detecting and replacing AI content")
-
-            # Extract text from slides
-            slides_text = analyzer.extract_text_from_pptx(temp_input)
-
-            # Detect AI content
-            detector = get_detector()
-            generator = ContentGenerator()
-
-            replacements = []
-            for slide_text in slides_text:
-                if not slide_text.text.strip():
-                    continue
-
-                detection = detector.detect(slide_text.text)
-
-                # Only replace if confidence exceeds threshold
-                if detection.is_ai_generated and detection.confidence >= confidence_threshold:
-                    logger.info(
-                        f"Replacing AI content in slide {slide_text.slide_number} "
-                        f"(confidence: {detection.confidence:.2f})"
-                    )
-
-                    # Generate alternative content
-                    new_text = generator.generate(slide_text.text)
-
-                    replacements.append(
-                        Replacement(
-                            slide_num=slide_text.slide_number,
-                            old_text=slide_text.text,
-                            new_text=new_text,
-                        )
-                    )
-
-            if replacements:
-                modifier.replace_content(replacements)
-                logger.info(f"Applied {len(replacements)} content replacements")
-            else:
-                logger.info("No AI content detected above threshold")
-
-        # Step 2: Apply style changes if requested
-        if font_name or text_color:
-            logger.info("Applying style modifications")
-
-            color_scheme = None
-            if text_color:
-                color_scheme = ColorScheme(text_color=text_color)
-
-            style_config = StyleConfig(font_name=font_name, color_scheme=color_scheme)
-
-            modifier.modify_styles(style_config)
-
-        # Step 3: Save modified presentation
-        temp_output = generate_temp_filename(".pptx")
-        modifier.save(temp_output)
-
-        logger.info(f"Presentation modified successfully: {temp_output}")
+        # Validate file, then stream it to disk, aborting once it exceeds the size limit
+        validate_pptx_file(file.filename or "unknown.pptx", file.size)
+        temp_input, _ = await save_upload_stream(file, file.filename or "upload.pptx", request_dir)
+
+        # Run the blocking detection/modification pipeline off the event loop
+        temp_output = await asyncio.to_thread(
+            _modify_presentation,
+            temp_input,
+            replace_ai_content,
+            font_name,
+            text_color,
+            confidence_threshold,
+        )
 
-        # Return modified file
+        # Return modified file and delete the request files once it has been sent.
+        # Passing the stat result up front avoids another stat call before sending.
         return FileResponse(
             temp_output,
             media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
             filename=f"modified_{file.filename or 'presentation.pptx'}",
+            stat_result=os.stat(temp_output),
+            background=BackgroundTask(cleanup_dir, request_dir),
         )
 
     except ValidationError as e:
+        cleanup_dir(request_dir)
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
     except Exception as e:
+        cleanup_dir(request_dir)
         logger.error(f"PPTX modification failed: {e}")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(e))
-    finally:
-        # Cleanup input file (output file will be cleaned up after response is sent)
-        if temp_input:
-            cleanup_file(temp_input)
+
+
+def _modify_presentation(
+    temp_input: str,
+    replace_ai_content: bool,
+    font_name: Optional[str],
+    text_color: Optional[str],
+    confidence_threshold: float,
+) -> str:
+    """
+    Detect, replace and restyle content in a saved presentation.
+
+    Runs model inference and python-pptx processing, so it blocks and is
+    meant to be run in a worker thread by the async endpoint.
+
+    Args:
+        temp_input: Path to the uploaded PPTX file.
+        replace_ai_content: Whether to replace AI-detected content.
+        font_name: Font name to apply (optional).
+        text_color: Text color in hex format (optional).
+        confidence_threshold: Minimum AI confidence for replacement (0.0-1.0).
+
+    Returns:
+        Path to the modified PPTX file, in the same directory as the input.
+    """
+    # Initialize components
+    analyzer = PPTAnalyzer()
+    modifier = PPTModifier(temp_input)
+
+    # Step 1: Generate replacements for AI content if requested
+    replacements = []
+    if replace_ai_content:
+        logger.info("Detecting and replacing AI content")
+
+        detector = get_detector()
+        generator = ContentGenerator()
+
+        # Extract text from the already loaded slides, keeping only slides that
+        # have any, and run detection on all of them in one batch
+        slides_text = [
+            slide_text
+            for slide_text in analyzer.iter_presentation_texts(modifier.presentation)
+            if slide_text.text.strip()
+        ]
+        detections = detector.detect_batch([slide_text.text for slide_text in slides_text])
+
+        # Only replace slides whose AI confidence exceeds the threshold
+        flagged = [
+            (slide_text, detection)
+            for slide_text, detection in zip(slides_text, detections)
+            if detection.is_ai_generated and detection.confidence >= confidence_threshold
+        ]
+
+        for slide_text, detection in flagged:
+            logger.info(
+                f"Replacing AI content in slide {slide_text.slide_number} "
+                f"(confidence: {detection.confidence:.2f})"
+            )
+
+        # Generate alternative content for all flagged slides
+        new_texts = generator.generate_batch([slide_text.text for slide_text, _ in flagged])
+
+        replacements = [
+            ReplacementT(
+                slide_num=slide_text.slide_number,
+                old_text=slide_text.text,
+                new_text=new_text,
+            )
+            for (slide_text, _), new_text in zip(flagged, new_texts)
+        ]
+
+        if not replacements:
+            logger.info("No AI content detected above threshold")
+
+    # Step 2: Build style changes if requested
+    style_config = None
+    if font_name or text_color:
+        style_config = StyleConfigT(font_name=font_name, text_color=text_color)
+
+    # Apply replacements and styles in a single pass over the slides
+    if replacements or style_config is not None:
+        modifier.apply(replacements, style_config)
+
+    # Step 3: Save modified presentation
+    temp_output = generate_temp_filename(".pptx", os.path.dirname(temp_input))
+    modifier.save_incremental(temp_output)
+
+    logger.info(f"Presentation modified successfully: {temp_output}")
+
+    return temp_output
@@ -1,5 +1,10 @@
 """AI content detection using HuggingFace transformers."""
 
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import torch
@@ -10,8 +15,18 @@ from post_automation.models.detection import DetectionResult
 from post_automation.utils.config import get_settings
 from post_automation.utils.logger import setup_logger
 
+try:
+    import onnxruntime as ort
+    from optimum.onnxruntime import ORTModelForSequenceClassification
+except ImportError:  # Optional dependency, only needed for the ONNX backend
+    ort = None
+    ORTModelForSequenceClassification = None
+
 logger = setup_logger(__name__)
 
+# Upper bound on tokens fed to the detector, further capped by the model config
+MAX_SEQUENCE_LENGTH = 512
+
 
 class AIDetector:
     """AI content detector using HuggingFace transformers."""
@@ -26,17 +41,53 @@ class AIDetector:
         settings = get_settings()
         self.model_name = model_name or settings.hf_model_name
         self.hf_token = settings.hf_token
+        self.backend = settings.detector_backend.lower()
+        self.precision = settings.detector_precision.lower()
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.batch_size = settings.batch_size
+
+        # LRU cache of detection results keyed by normalized text hash
+        self._cache: OrderedDict[bytes, DetectionResult] = OrderedDict()
+        self._cache_size = settings.detector_cache_size
+        self._cache_lock = threading.Lock()
 
         logger.info(f"Initializing AI detector with model: {self.model_name}")
 
         # Load tokenizer and model
-        self.tokenizer = AutoTokenizer.from_pretrained(self.model_name, token=self.hf_token)
-        self.model = AutoModelForSequenceClassification.from_pretrained(
-            self.model_name, token=self.hf_token
+        # Use the Rust-backed fast tokenizer, which encodes batches in parallel
+        self.tokenizer = AutoTokenizer.from_pretrained(
+            self.model_name, token=self.hf_token, use_fast=True
+        )
+
+        if self.backend == "onnx" and ORTModelForSequenceClassification is None:
+            logger.warning("ONNX backend requires optimum[onnxruntime], falling back to torch")
+            self.backend = "torch"
+
+        if self.backend == "onnx":
+            self.model = self._load_onnx_model()
+        else:
+            self.model = AutoModelForSequenceClassification.from_pretrained(
+                self.model_name, token=self.hf_token
+            )
+
+            # Set to evaluation mode
+            self.model.eval()
+
+            # Reduce precision if configured, then move to the target device
+            self.model = self._apply_precision(self.model).to(self.device)
+
+        # Never tokenize past what the model's position embeddings support. Batches are
+        # padded to a multiple of 8, so round down to keep padding within the limit too
+        self.max_length = min(
+            MAX_SEQUENCE_LENGTH,
+            getattr(self.model.config, "max_position_embeddings", MAX_SEQUENCE_LENGTH),
         )
+        self.max_length -= self.max_length % 8
+        self.tokenizer.model_max_length = self.max_length
 
-        # Set to evaluation mode
-        self.model.eval()
+        self.compiled = False
+        if settings.detector_compile:
+            self._compile_model()
 
         logger.info("AI detector initialized successfully")
 
@@ -57,57 +108,310 @@ class AIDetector:
                 f"({MIN_TEXT_LENGTH_FOR_DETECTION}). Results may be unreliable."
             )
 
-        # Tokenize input
-        inputs = self.tokenizer(
-            text, return_tensors="pt", truncation=True, max_length=512, padding=True
-        )
-
-        # Run inference
-        with torch.no_grad():
-            outputs = self.model(**inputs)
-            probabilities = torch.softmax(outputs.logits, dim=-1)
+        # Return cached result for previously seen text
+        key = self._cache_key(text)
+        cached = self._cache_get(key)
+        if cached is not None:
+            logger.debug(f"Detection cache hit for text of length {len(text)}")
+            return cached
 
-        # Extract AI probability (assuming label 1 is AI)
-        # Note: This may vary depending on the model. Adjust if needed.
-        ai_probability = float(probabilities[0][1])
+        ai_probability = self._predict([text])[0]
 
-        is_ai = ai_probability > 0.5
-        label = "AI" if is_ai else "Human"
+        result = self._build_result(ai_probability)
+        self._cache_put(key, result)
 
         logger.info(
-            f"Detection complete: {label} (confidence: {ai_probability:.2f}) "
+            f"Detection complete: {result.label} (confidence: {ai_probability:.2f}) "
             f"for text of length {len(text)}"
         )
 
-        return DetectionResult(
-            is_ai_generated=is_ai,
-            confidence=ai_probability,
-            label=label,
-            model_name=self.model_name,
-        )
+        return result
 
-    def detect_batch(self, texts: list[str]) -> list[DetectionResult]:
+    def detect_batch(
+        self, texts: list[str], batch_size: Optional[int] = None
+    ) -> list[DetectionResult]:
         """
-        Detect AI content in multiple texts.
+        Detect AI content in multiple texts using batched forward passes.
+
+        Empty texts are not sent to the model and are reported as human-written
+        with zero confidence, so the returned list always lines up with ``texts``.
+        Cached texts are served from the cache and only the remaining unique
+        texts go through the model, at most ``batch_size`` per forward pass.
 
         Args:
             texts: List of texts to analyze.
+            batch_size: Maximum texts per forward pass. If None, uses config default.
 
         Returns:
-            List of detection results.
+            List of detection results, one per input text.
         """
         logger.info(f"Running batch detection on {len(texts)} texts")
-        results = []
 
-        for text in texts:
-            result = self.detect(text)
-            results.append(result)
+        results = [self._build_result(0.0) for _ in texts]
+
+        # Serve cache hits and group the misses by key so duplicates run once
+        misses: dict[bytes, list[int]] = {}
+        for i, text in enumerate(texts):
+            if not text.strip():
+                continue
+
+            key = self._cache_key(text)
+            cached = self._cache_get(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                misses.setdefault(key, []).append(i)
+
+        if not misses:
+            return results
+
+        batch_size = batch_size or self.batch_size
+        miss_texts = [texts[indices[0]] for indices in misses.values()]
+        batches = [
+            miss_texts[start : start + batch_size]
+            for start in range(0, len(miss_texts), batch_size)
+        ]
+        ai_probabilities = self._predict_batches(batches)
+
+        for (key, indices), ai_probability in zip(misses.items(), ai_probabilities):
+            result = self._build_result(ai_probability)
+            self._cache_put(key, result)
+            for i in indices:
+                results[i] = result
+
+        logger.info(f"Batch detection complete: {len(misses)} texts run through the model")
 
         return results
 
+    def warmup(self) -> None:
+        """Run a dummy forward pass so the first real request does not pay for it."""
+        logger.info("Warming up AI detector")
+        self._predict(["warmup " * 20])
+
+    def _predict(self, texts: list[str]) -> list[float]:
+        """
+        Run texts through the model in a single forward pass.
+
+        Args:
+            texts: Non-empty texts to classify.
+
+        Returns:
+            AI probability for each text.
+        """
+        return self._forward(self._tokenize(texts))
+
+    def _predict_batches(self, batches: list[list[str]]) -> list[float]:
+        """
+        Run several batches through the model, one forward pass each.
+
+        The next batch is tokenized in a background thread while the model runs
+        the current one. Both the fast tokenizer and the forward pass release the
+        GIL, so the two overlap.
+
+        Args:
+            batches: Batches of non-empty texts to classify.
+
+        Returns:
+            AI probability for each text, in batch order.
+        """
+        if len(batches) == 1:
+            return self._predict(batches[0])
+
+        ai_probabilities: list[float] = []
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            pending = executor.submit(self._tokenize, batches[0])
+            for next_batch in batches[1:] + [None]:
+                inputs = pending.result()
+                if next_batch is not None:
+                    pending = executor.submit(self._tokenize, next_batch)
+                ai_probabilities.extend(self._forward(inputs))
+
+        return ai_probabilities
+
+    def _forward(self, inputs) -> list[float]:
+        """
+        Run a tokenized batch through the model.
+
+        Args:
+            inputs: Batch encoding from ``_tokenize``.
+
+        Returns:
+            AI probability for each text in the batch.
+        """
+        inputs = inputs.to(self.device)
+
+        # Run inference on the whole batch
+        with torch.inference_mode():
+            outputs = self.model(**inputs)
+            # Softmax in FP32 to keep probabilities calibrated under FP16.
+            # Label 1 is assumed to be AI; this may vary depending on the model.
+            return outputs.logits.float().softmax(-1)[:, 1].cpu().tolist()
+
+    def _tokenize(self, texts: list[str]):
+        """
+        Tokenize texts into a padded batch of tensors.
+
+        Args:
+            texts: Texts to tokenize.
+
+        Returns:
+            Batch encoding with PyTorch tensors.
+        """
+        # Pad only to the longest sequence in the batch, rounded up to a multiple of 8
+        # so the sequence dimension stays aligned for tensor cores and SIMD kernels
+        return self.tokenizer(
+            texts,
+            return_tensors="pt",
+            truncation=True,
+            max_length=self.max_length,
+            padding="longest",
+            pad_to_multiple_of=8,
+        )
+
+    def _compile_model(self) -> None:
+        """Compile the torch model, leaving it in eager mode if compilation is unavailable."""
+        if self.backend != "torch":
+            logger.warning("torch.compile only applies to the torch backend, skipping")
+            return
 
-# Singleton instance (lazy-loaded)
+        if not hasattr(torch, "compile"):
+            logger.warning("torch.compile requires PyTorch 2.0 or newer, skipping")
+            return
+
+        # Batch size and sequence length vary per call, so compile with dynamic shapes
+        # rather than recompiling for every new input shape
+        logger.info("Compiling AI detector model with torch.compile")
+        self.model = torch.compile(self.model, mode="reduce-overhead", dynamic=True)
+        self.compiled = True
+
+    def _cache_key(self, text: str) -> bytes:
+        """
+        Compute the cache key for a text.
+
+        Args:
+            text: Text to hash.
+
+        Returns:
+            Digest of the stripped text.
+        """
+        return hashlib.blake2b(text.strip().encode(), digest_size=16).digest()
+
+    def _cache_get(self, key: bytes) -> Optional[DetectionResult]:
+        """
+        Look up a cached detection result and mark it as recently used.
+
+        Args:
+            key: Cache key from ``_cache_key``.
+
+        Returns:
+            Cached result, or None on a miss.
+        """
+        with self._cache_lock:
+            result = self._cache.get(key)
+            if result is not None:
+                self._cache.move_to_end(key)
+            return result
+
+    def _cache_put(self, key: bytes, result: DetectionResult) -> None:
+        """
+        Store a detection result, evicting the least recently used entries.
+
+        Args:
+            key: Cache key from ``_cache_key``.
+            result: Detection result to cache.
+        """
+        if self._cache_size <= 0:
+            return
+
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _load_onnx_model(self):
+        """
+        Export the model to ONNX and load it into an ONNX Runtime session.
+
+        The session is created once with full graph optimization so attention
+        and LayerNorm are fused. Precision settings do not apply to this backend.
+
+        Returns:
+            ONNX Runtime sequence classification model.
+        """
+        logger.info("Using ONNX Runtime backend for AI detector")
+
+        session_options = ort.SessionOptions()
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        session_options.intra_op_num_threads = os.cpu_count() or 1
+
+        provider = (
+            "CUDAExecutionProvider" if self.device.type == "cuda" else "CPUExecutionProvider"
+        )
+
+        return ORTModelForSequenceClassification.from_pretrained(
+            self.model_name,
+            export=True,
+            provider=provider,
+            session_options=session_options,
+            token=self.hf_token,
+        )
+
+    def _apply_precision(self, model):
+        """
+        Convert the model to the configured inference precision.
+
+        FP16 is only used on CUDA and int8 dynamic quantization only on CPU;
+        unsupported combinations fall back to FP32.
+
+        Args:
+            model: Loaded sequence classification model.
+
+        Returns:
+            Model in the requested precision.
+        """
+        if self.precision == "fp16":
+            if self.device.type == "cuda":
+                logger.info("Using FP16 precision for AI detector")
+                return model.half()
+            logger.warning("FP16 precision requires CUDA, falling back to FP32")
+
+        elif self.precision == "int8":
+            if self.device.type == "cpu":
+                logger.info("Using int8 dynamic quantization for AI detector")
+                return torch.ao.quantization.quantize_dynamic(
+                    model, {torch.nn.Linear}, dtype=torch.qint8
+                )
+            logger.warning("int8 quantization is only supported on CPU, falling back to FP32")
+
+        elif self.precision != "fp32":
+            logger.warning(f"Unknown detector precision '{self.precision}', using FP32")
+
+        return model
+
+    def _build_result(self, ai_probability: float) -> DetectionResult:
+        """
+        Build a detection result from the AI class probability.
+
+        Args:
+            ai_probability: Probability that the text is AI-generated.
+
+        Returns:
+            Detection result.
+        """
+        is_ai = ai_probability > 0.5
+
+        return DetectionResult(
+            is_ai_generated=is_ai,
+            confidence=ai_probability,
+            label="AI" if is_ai else "Human",
+            model_name=self.model_name,
+        )
+
+
+# Singleton instance (lazy-loaded, guarded against concurrent first use)
 _detector_instance: Optional[AIDetector] = None
+_detector_lock = threading.Lock()
 
 
 def get_detector(model_name: Optional[str] = None) -> AIDetector:
@@ -123,6 +427,18 @@ def get_detector(model_name: Optional[str] = None) -> AIDetector:
     global _detector_instance
 
     if _detector_instance is None:
-        _detector_instance = AIDetector(model_name)
+        with _detector_lock:
+            if _detector_instance is None:
+                _detector_instance = AIDetector(model_name)
 
     return _detector_instance
+
+
+def is_detector_loaded() -> bool:
+    """
+    Check whether the singleton detector has been loaded, without loading it.
+
+    Returns:
+        True if the detector instance exists.
+    """
+    return _detector_instance is not None
@@ -0,0 +1,189 @@
+"""Dynamic batching of concurrent AI detection requests."""
+
+import asyncio
+from typing import List, Optional, Tuple
+
+from post_automation.core.ai_detector import AIDetector
+from post_automation.models.detection import DetectionResult
+from post_automation.utils.config import get_settings
+from post_automation.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class AsyncBatcher:
+    """Coalesce concurrent detection requests into batched model calls."""
+
+    def __init__(
+        self,
+        detector: AIDetector,
+        max_batch_size: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+    ):
+        """
+        Initialize batcher.
+
+        Args:
+            detector: AI detector used to run the batches.
+            max_batch_size: Maximum texts per batch. If None, uses config default.
+            max_wait_ms: Maximum time to wait for a batch to fill, in milliseconds.
+                If None, uses config default.
+        """
+        settings = get_settings()
+        self.detector = detector
+        self.max_batch_size = max_batch_size or settings.batch_size
+        self.max_wait = (
+            max_wait_ms if max_wait_ms is not None else settings.batch_timeout_ms
+        ) / 1000
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def submit(self, text: str) -> DetectionResult:
+        """
+        Queue text for detection and wait for its result.
+
+        Args:
+            text: Text to analyze.
+
+        Returns:
+            Detection result for the text.
+        """
+        self._ensure_worker()
+
+        future = self._loop.create_future()
+        await self._queue.put((text, future))
+
+        return await future
+
+    async def close(self) -> None:
+        """Stop the background worker and cancel requests still waiting for it."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        self._fail_pending(None)
+
+    def _ensure_worker(self) -> None:
+        """Start the background worker on the running event loop if needed."""
+        loop = asyncio.get_running_loop()
+
+        # A queue only works on the loop it was used on, so requests left on a previous
+        # loop can never be processed
+        if self._loop is not loop:
+            self._fail_pending(RuntimeError("Detection batcher moved to another event loop"))
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = None
+
+        # Requests already queued are picked up by the restarted worker
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run())
+
+    def _fail_pending(self, error: Optional[Exception]) -> None:
+        """
+        Resolve every request still in the queue without running it.
+
+        Args:
+            error: Exception to raise in the waiting callers, or None to cancel them.
+        """
+        if self._queue is None:
+            return
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if future.done():
+                continue
+            try:
+                if error is None:
+                    future.cancel()
+                else:
+                    future.set_exception(error)
+            except RuntimeError:
+                # The future's event loop is already closed, nobody is waiting on it
+                pass
+
+    async def _run(self) -> None:
+        """Collect queued requests into batches and run them through the detector."""
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = self._loop.time() + self.max_wait
+
+                # Keep filling the batch until it is full or the wait time runs out
+                while len(batch) < self.max_batch_size:
+                    timeout = deadline - self._loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                    except asyncio.TimeoutError:
+                        break
+
+                await self._process_batch(batch)
+            except asyncio.CancelledError:
+                # Do not leave callers of an interrupted batch waiting forever
+                for _, future in batch:
+                    future.cancel()
+                raise
+
+    async def _process_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        """
+        Run one batch through the detector and resolve the waiting futures.
+
+        Args:
+            batch: Queued (text, future) pairs.
+        """
+        logger.debug(f"Processing detection batch of {len(batch)} requests")
+
+        try:
+            results = await asyncio.to_thread(
+                self.detector.detect_batch, [text for text, _ in batch]
+            )
+        except Exception as e:
+            logger.error(f"Batched detection failed: {e}")
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            # Skip requests that were cancelled while waiting
+            if not future.done():
+                future.set_result(result)
+
+
+# Singleton instance (lazy-loaded)
+_batcher_instance: Optional[AsyncBatcher] = None
+
+
+def get_batcher(detector: AIDetector) -> AsyncBatcher:
+    """
+    Get singleton batcher instance.
+
+    Args:
+        detector: AI detector to batch for when the batcher is first created.
+
+    Returns:
+        Batcher instance.
+    """
+    global _batcher_instance
+
+    if _batcher_instance is None:
+        _batcher_instance = AsyncBatcher(detector)
+
+    return _batcher_instance
+
+
+async def close_batcher() -> None:
+    """Stop the singleton batcher's worker, if it was created, and drop the instance."""
+    global _batcher_instance
+
+    if _batcher_instance is not None:
+        await _batcher_instance.close()
+        _batcher_instance = None
@@ -1,12 +1,29 @@
 """Alternative content generation for AI-detected text."""
 
 import re
-from typing import Dict
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
 
 from post_automation.utils.logger import setup_logger
 
+try:
+    import hyperscan
+except ImportError:  # Optional dependency, the regex implementation is used without it
+    hyperscan = None
+
 logger = setup_logger(__name__)
 
+# Sentence simplification patterns
+_DOUBLE_THAT = re.compile(r"\bthat\s+that\b", re.IGNORECASE)
+_IS_BEING = re.compile(r"\bis being\s+(\w+ed)\b", re.IGNORECASE)
+_DOUBLE_VERY = re.compile(r"\bvery\s+very\b", re.IGNORECASE)
+
+# The only non-ASCII characters re.IGNORECASE matches to ASCII letters (İ and ı to i,
+# ſ to s, the Kelvin sign to k). Hyperscan's caseless mode does not, so texts containing
+# them take the regex path to keep a single case-folding rule.
+_UNICODE_CASE_VARIANTS = re.compile("[\u0130\u0131\u017f\u212a]")
+
 
 class ContentGenerator:
     """Generator for creating alternative content to replace AI-generated text."""
@@ -37,6 +54,19 @@ class ContentGenerator:
             "perform an analysis": "analyze",
         }
 
+        # Combine all phrases into one pattern so text is scanned once.
+        # Longer phrases come first so they win over their own prefixes.
+        self._phrases: List[str] = sorted(self.word_replacements, key=len, reverse=True)
+        # Each phrase gets its own group, so a match is mapped back to its phrase by
+        # position: case-insensitive matches such as "UTİLİZE" do not lowercase to a key
+        self._replacement_pattern = re.compile(
+            "|".join(f"({re.escape(phrase)})" for phrase in self._phrases), re.IGNORECASE
+        )
+
+        # Compile the phrases into a Hyperscan DFA when available
+        self._hs_database = self._build_hyperscan_database() if hyperscan else None
+        self._hs_local = threading.local()
+
         logger.info("Content generator initialized with rule-based transformations")
 
     def generate(self, text: str) -> str:
@@ -54,13 +84,13 @@ class ContentGenerator:
         """
         logger.info(f"Generating alternative for text of length {len(text)}")
 
-        modified_text = text
-
-        # Apply word replacements
-        for phrase, replacement in self.word_replacements.items():
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(phrase), re.IGNORECASE)
-            modified_text = pattern.sub(replacement, modified_text)
+        # Apply word replacements (case-insensitive, single pass)
+        if self._hs_database is not None and (
+            text.isascii() or not _UNICODE_CASE_VARIANTS.search(text)
+        ):
+            modified_text = self._replace_with_hyperscan(text)
+        else:
+            modified_text = self._replacement_pattern.sub(self._regex_replacement, text)
 
         # Simple sentence restructuring
         modified_text = self._simplify_sentences(modified_text)
@@ -69,6 +99,103 @@ class ContentGenerator:
 
         return modified_text
 
+    def generate_batch(self, texts: List[str]) -> List[str]:
+        """
+        Generate alternative content for several texts.
+
+        With Hyperscan the scans release the GIL, so texts are processed in a
+        thread pool. The regex fallback holds the GIL and runs sequentially.
+
+        Args:
+            texts: Original AI-generated texts.
+
+        Returns:
+            Modified texts, in the same order as ``texts``.
+        """
+        if self._hs_database is None or len(texts) < 2:
+            return [self.generate(text) for text in texts]
+
+        with ThreadPoolExecutor() as executor:
+            return list(executor.map(self.generate, texts))
+
+    def _regex_replacement(self, match: re.Match) -> str:
+        """
+        Get the replacement for a match of the combined phrase pattern.
+
+        Args:
+            match: Match of the combined phrase pattern.
+
+        Returns:
+            Replacement text for the matched phrase.
+        """
+        return self.word_replacements[self._phrases[match.lastindex - 1]]
+
+    def _build_hyperscan_database(self):
+        """
+        Compile all replacement phrases into a single Hyperscan database.
+
+        Returns:
+            Hyperscan block-mode database.
+        """
+        flags = hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SOM_LEFTMOST
+
+        database = hyperscan.Database()
+        database.compile(
+            expressions=[re.escape(phrase).encode() for phrase in self._phrases],
+            ids=list(range(len(self._phrases))),
+            elements=len(self._phrases),
+            flags=[flags] * len(self._phrases),
+        )
+
+        self._hs_replacements = [
+            self.word_replacements[phrase].encode() for phrase in self._phrases
+        ]
+
+        logger.info("Compiled replacement phrases with Hyperscan")
+        return database
+
+    def _replace_with_hyperscan(self, text: str) -> str:
+        """
+        Apply word replacements using the Hyperscan database.
+
+        Matches are resolved like the regex fallback: leftmost first, longest
+        phrase on ties, and without overlaps. Caseless matching only folds ASCII
+        letters, so texts with other case variants must use the regex instead.
+
+        Args:
+            text: Text to rewrite.
+
+        Returns:
+            Text with phrases replaced.
+        """
+        # Scratch space cannot be shared between concurrent scans
+        scratch = getattr(self._hs_local, "scratch", None)
+        if scratch is None:
+            scratch = self._hs_local.scratch = hyperscan.Scratch(self._hs_database)
+
+        data = text.encode()
+        matches: List[Tuple[int, int, int]] = []
+
+        def on_match(phrase_id, start, end, flags, context):
+            matches.append((start, -end, phrase_id))
+
+        self._hs_database.scan(data, match_event_handler=on_match, scratch=scratch)
+
+        if not matches:
+            return text
+
+        parts = []
+        position = 0
+        for start, neg_end, phrase_id in sorted(matches):
+            if start < position:
+                continue
+            parts.append(data[position:start])
+            parts.append(self._hs_replacements[phrase_id])
+            position = -neg_end
+        parts.append(data[position:])
+
+        return b"".join(parts).decode()
+
     def _simplify_sentences(self, text: str) -> str:
         """
         Apply simple sentence simplification rules.
@@ -80,15 +207,13 @@ class ContentGenerator:
             Simplified text.
         """
         # Remove excessive "that" usage
-        text = re.sub(r"\bthat\s+that\b", "that", text, flags=re.IGNORECASE)
+        text = _DOUBLE_THAT.sub("that", text)
 
         # Simplify passive voice (basic patterns)
-        text = re.sub(
-            r"\bis being\s+(\w+ed)\b", r"is \1", text, flags=re.IGNORECASE
-        )
+        text = _IS_BEING.sub(r"is \1", text)
 
         # Remove redundant "very" usage
-        text = re.sub(r"\bvery\s+very\b", "very", text, flags=re.IGNORECASE)
+        text = _DOUBLE_VERY.sub("very", text)
 
         return text
 
@@ -1,6 +1,10 @@
 """PowerPoint text extraction and analysis."""
 
-from typing import List
+import io
+import posixpath
+import zipfile
+from typing import IO, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree
 
 from pptx import Presentation
 
@@ -9,48 +13,142 @@ from post_automation.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# OOXML namespaces used by the streaming extractor
+_NS_A = "{http://schemas.openxmlformats.org/drawingml/2006/main}"
+_NS_P = "{http://schemas.openxmlformats.org/presentationml/2006/main}"
+_NS_R = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+_NS_REL = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Elements counted as shapes when they are direct children of the shape tree
+_SHAPE_TAGS = frozenset(
+    f"{_NS_P}{tag}" for tag in ("sp", "grpSp", "graphicFrame", "cxnSp", "pic", "contentPart")
+)
+
 
 class PPTAnalyzer:
     """Analyzer for extracting text from PowerPoint presentations."""
 
-    def extract_text_from_pptx(self, pptx_path: str) -> List[SlideText]:
+    def extract_text_from_pptx(self, pptx_path: Union[str, IO[bytes]]) -> List[SlideText]:
         """
         Extract text from PowerPoint file.
 
         Args:
-            pptx_path: Path to PPTX file.
+            pptx_path: Path to PPTX file, or a seekable binary file object.
 
         Returns:
             List of SlideText objects with extracted text.
         """
-        logger.info(f"Extracting text from: {pptx_path}")
+        results = list(self.iter_slide_texts(pptx_path))
+        logger.info(f"Successfully extracted text from {len(results)} slides")
+        return results
+
+    def extract_text_from_bytes(
+        self, data: bytes, name: str = "presentation.pptx"
+    ) -> List[SlideText]:
+        """
+        Extract text from in-memory PowerPoint content.
+
+        Args:
+            data: PowerPoint file content.
+            name: Name used to identify the presentation in logs.
+
+        Returns:
+            List of SlideText objects with extracted text.
+        """
+        results = list(self.iter_slide_texts(io.BytesIO(data), name))
+        logger.info(f"Successfully extracted text from {len(results)} slides")
+        return results
+
+    def iter_slide_texts(
+        self, pptx_path: Union[str, IO[bytes]], name: Optional[str] = None
+    ) -> Iterator[SlideText]:
+        """
+        Lazily extract text from PowerPoint file, one slide at a time.
+
+        Args:
+            pptx_path: Path to PPTX file, or a seekable binary file object.
+            name: Name used to identify the presentation in logs. If None, uses the
+                path or the file object's name.
+
+        Yields:
+            SlideText for each slide, in presentation order.
+        """
+        if name is None:
+            name = pptx_path if isinstance(pptx_path, str) else getattr(pptx_path, "name", None)
+            name = name or "presentation.pptx"
+
+        logger.info(f"Extracting text from: {name}")
 
         try:
             prs = Presentation(pptx_path)
-            results = []
+            yield from self.iter_presentation_texts(prs)
 
-            for i, slide in enumerate(prs.slides):
-                slide_text_parts = []
+        except Exception as e:
+            logger.error(f"Failed to extract text from {name}: {e}")
+            raise
 
-                # Extract text from all shapes
-                for shape in slide.shapes:
-                    text = self._extract_text_from_shape(shape)
-                    if text.strip():
-                        slide_text_parts.append(text)
+    def iter_presentation_texts(self, prs) -> Iterator[SlideText]:
+        """
+        Lazily extract text from an already loaded presentation, one slide at a time.
 
-                # Combine all text parts
-                combined_text = " ".join(slide_text_parts)
+        Args:
+            prs: python-pptx Presentation object.
 
-                results.append(
-                    SlideText(
-                        slide_number=i, text=combined_text, shape_count=len(slide.shapes)
+        Yields:
+            SlideText for each slide, in presentation order.
+        """
+        for i, slide in enumerate(prs.slides):
+            slide_text_parts = []
+
+            # Extract text from all shapes
+            for shape in slide.shapes:
+                text = self._extract_text_from_shape(shape)
+                if text.strip():
+                    slide_text_parts.append(text)
+
+            # Combine all text parts
+            combined_text = " ".join(slide_text_parts)
+
+            logger.debug(
+                f"Slide {i}: Extracted {len(combined_text)} characters "
+                f"from {len(slide.shapes)} shapes"
+            )
+
+            yield SlideText(slide_number=i, text=combined_text, shape_count=len(slide.shapes))
+
+    def extract_text_fast(self, pptx_path: str) -> List[SlideText]:
+        """
+        Extract slide text by streaming the slide XML parts of the PPTX archive.
+
+        Unlike ``extract_text_from_pptx`` this does not build the python-pptx
+        object model, so it is much cheaper for read-only workflows such as
+        detection. Paragraphs are collected in document order, which covers
+        text frames, tables and grouped shapes.
+
+        Args:
+            pptx_path: Path to PPTX file.
+
+        Returns:
+            List of SlideText objects with extracted text.
+        """
+        logger.info(f"Extracting text (streaming) from: {pptx_path}")
+
+        try:
+            results = []
+
+            with zipfile.ZipFile(pptx_path) as archive:
+                for i, slide_part in enumerate(get_slide_part_names(archive)):
+                    with archive.open(slide_part) as f:
+                        combined_text, shape_count = self._stream_slide_text(f)
+
+                    results.append(
+                        SlideText(slide_number=i, text=combined_text, shape_count=shape_count)
                     )
-                )
 
-                logger.debug(
-                    f"Slide {i}: Extracted {len(combined_text)} characters "
-                    f"from {len(slide.shapes)} shapes"
-                )
+                    logger.debug(
+                        f"Slide {i}: Extracted {len(combined_text)} characters "
+                        f"from {shape_count} shapes"
+                    )
 
             logger.info(f"Successfully extracted text from {len(results)} slides")
             return results
@@ -59,6 +157,60 @@ class PPTAnalyzer:
             logger.error(f"Failed to extract text from {pptx_path}: {e}")
             raise
 
+    def _stream_slide_text(self, slide_xml: IO[bytes]) -> Tuple[str, int]:
+        """
+        Collect paragraph text and shape count from a slide XML stream.
+
+        Args:
+            slide_xml: Slide XML file object.
+
+        Returns:
+            Tuple of combined slide text and number of top-level shapes.
+        """
+        text_parts = []
+        paragraph_parts = []
+        # Paragraphs of the table cell being parsed, None outside of table cells
+        cell_paragraphs = None
+        shape_count = 0
+        depth = 0
+        shape_tree_depth = None
+
+        for event, elem in ElementTree.iterparse(slide_xml, events=("start", "end")):
+            if event == "start":
+                depth += 1
+                if elem.tag == f"{_NS_P}spTree" and shape_tree_depth is None:
+                    shape_tree_depth = depth
+                elif shape_tree_depth is not None and depth == shape_tree_depth + 1:
+                    if elem.tag in _SHAPE_TAGS:
+                        shape_count += 1
+                elif elem.tag == f"{_NS_A}tc":
+                    cell_paragraphs = []
+                continue
+
+            depth -= 1
+
+            if elem.tag == f"{_NS_A}t":
+                paragraph_parts.append(elem.text or "")
+            elif elem.tag == f"{_NS_A}br":
+                paragraph_parts.append("\v")
+            elif elem.tag == f"{_NS_A}p":
+                if cell_paragraphs is not None:
+                    cell_paragraphs.append("".join(paragraph_parts))
+                else:
+                    paragraph_text = "".join(paragraph_parts).strip()
+                    if paragraph_text:
+                        text_parts.append(paragraph_text)
+                paragraph_parts = []
+                elem.clear()
+            elif elem.tag == f"{_NS_A}tc":
+                # Match python-pptx's cell.text, which joins cell paragraphs with newlines
+                cell_text = "\n".join(cell_paragraphs).strip()
+                if cell_text:
+                    text_parts.append(cell_text)
+                cell_paragraphs = None
+
+        return " ".join(text_parts), shape_count
+
     def _extract_text_from_shape(self, shape) -> str:
         """
         Extract text from a single shape.
@@ -72,14 +224,14 @@ class PPTAnalyzer:
         text_parts = []
 
         # Handle text frames
-        if hasattr(shape, "text_frame"):
+        if shape.has_text_frame:
             for paragraph in shape.text_frame.paragraphs:
                 para_text = paragraph.text.strip()
                 if para_text:
                     text_parts.append(para_text)
 
         # Handle tables
-        if hasattr(shape, "table"):
+        if shape.has_table:
             table_text = self._extract_table_text(shape.table)
             if table_text:
                 text_parts.append(table_text)
@@ -138,3 +290,29 @@ class PPTAnalyzer:
         except Exception as e:
             logger.error(f"Failed to get presentation info: {e}")
             raise
+
+
+def get_slide_part_names(archive: zipfile.ZipFile) -> List[str]:
+    """
+    Resolve slide part names in presentation order.
+
+    Args:
+        archive: Open PPTX archive.
+
+    Returns:
+        Zip entry names of the slide parts.
+    """
+    rels = ElementTree.fromstring(archive.read("ppt/_rels/presentation.xml.rels"))
+    targets = {rel.get("Id"): rel.get("Target") for rel in rels.iter(f"{_NS_REL}Relationship")}
+
+    presentation = ElementTree.fromstring(archive.read("ppt/presentation.xml"))
+    part_names = []
+
+    for slide_id in presentation.iter(f"{_NS_P}sldId"):
+        target = targets[slide_id.get(f"{_NS_R}id")]
+        if target.startswith("/"):
+            part_names.append(target.lstrip("/"))
+        else:
+            part_names.append(posixpath.normpath(posixpath.join("ppt", target)))
+
+    return part_names
@@ -1,185 +1,444 @@
 """PowerPoint modification utilities."""
 
-from typing import List, Optional
-
+import io
+import multiprocessing
+import os
+import re
+import threading
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache, partial
+from itertools import repeat
+from typing import IO, Callable, Dict, List, Optional, Set, Tuple, Union
+
+from lxml import etree
 from pptx import Presentation
-from pptx.util import Pt, RGBColor
-
-from post_automation.models.ppt import Replacement, StyleConfig
+from pptx.dml.color import RGBColor
+from pptx.opc.oxml import serialize_part_xml
+from pptx.oxml import parse_xml
+from pptx.slide import Slide
+from pptx.text.text import Font
+from pptx.util import Length, Pt
+
+from post_automation.core.ppt_analyzer import get_slide_part_names
+from post_automation.models.ppt import Replacement, ReplacementT, StyleConfig, StyleConfigT
+from post_automation.utils.config import get_settings
 from post_automation.utils.logger import setup_logger
 
+try:
+    import ahocorasick
+except ImportError:  # Optional dependency, substring replacement is used without it
+    ahocorasick = None
+
 logger = setup_logger(__name__)
 
+# Minimum number of patterns per slide before an Aho-Corasick automaton beats a regex
+AHO_CORASICK_MIN_PATTERNS = 4
+
+# Applies all of a slide's replacements to a text in one pass
+Replacer = Callable[[str], str]
+
+# Replacements accepted from callers, either the API model or its internal twin
+AnyReplacement = Union[Replacement, ReplacementT]
+
+# Resolved (font_name, font_size, rgb) styles, snapshotted from a StyleConfigT
+ResolvedStyles = Tuple[Optional[str], Optional[Length], Optional[RGBColor]]
+
+# Minimum number of slides to modify before worker process overhead pays off
+PARALLEL_MIN_SLIDES = 8
+
+# Font sizes accepted by StyleConfig, prebuilt as lengths
+_PT_SIZES: Dict[int, Length] = {size: Pt(size) for size in range(8, 73)}
+
+# Interned text colors, shared by every styling pass in the process
+_RGB_CACHE: Dict[Tuple[int, int, int], RGBColor] = {}
+
+# Text runs of a slide's top-level shape text frames and table cells
+_RUN_XPATH = etree.XPath(
+    "./p:cSld/p:spTree/p:sp/p:txBody/a:p/a:r"
+    " | ./p:cSld/p:spTree/p:graphicFrame/a:graphic/a:graphicData/a:tbl/a:tr/a:tc/a:txBody/a:p/a:r",
+    namespaces={
+        "a": "http://schemas.openxmlformats.org/drawingml/2006/main",
+        "p": "http://schemas.openxmlformats.org/presentationml/2006/main",
+    },
+)
+
 
 class PPTModifier:
     """Modifier for PowerPoint presentations."""
 
-    def __init__(self, pptx_path: str):
+    def __init__(self, pptx_path: Union[str, IO[bytes]]):
         """
         Initialize PPT modifier.
 
         Args:
-            pptx_path: Path to PowerPoint file.
+            pptx_path: Path to PowerPoint file, or a seekable binary file object. A file
+                object must stay open while the modifier is in use.
         """
-        self.pptx_path = pptx_path
-        self.presentation = Presentation(pptx_path)
-        logger.info(f"Loaded presentation: {pptx_path}")
+        name = pptx_path if isinstance(pptx_path, str) else getattr(pptx_path, "name", None)
+        self._load(pptx_path, name or "presentation.pptx")
 
-    def replace_content(self, replacements: List[Replacement]) -> None:
+    @classmethod
+    def from_bytes(cls, data: bytes, name: str = "presentation.pptx") -> "PPTModifier":
         """
-        Replace text content in slides.
+        Create a modifier from in-memory PowerPoint content.
 
         Args:
-            replacements: List of text replacements to apply.
+            data: PowerPoint file content.
+            name: Name used to identify the presentation in logs.
+
+        Returns:
+            Modifier for the presentation.
         """
-        logger.info(f"Applying {len(replacements)} content replacements")
+        modifier = cls.__new__(cls)
+        modifier._load(io.BytesIO(data), name)
+        return modifier
 
-        for replacement in replacements:
-            try:
-                self._replace_in_slide(
-                    replacement.slide_num, replacement.old_text, replacement.new_text
-                )
-                logger.debug(
-                    f"Replaced text in slide {replacement.slide_num}: "
-                    f"'{replacement.old_text[:50]}...' -> '{replacement.new_text[:50]}...'"
-                )
-            except Exception as e:
-                logger.error(
-                    f"Failed to replace content in slide {replacement.slide_num}: {e}"
-                )
+    def _load(self, source: Union[str, IO[bytes]], name: str) -> None:
+        """
+        Load the presentation and initialize modifier state.
 
-    def _replace_in_slide(self, slide_num: int, old_text: str, new_text: str) -> None:
+        Args:
+            source: Path or file object of the PowerPoint file.
+            name: Name used to identify the presentation in logs.
         """
-        Replace text in a specific slide.
+        self.pptx_path = name
+        self._source = source
+        self.presentation = Presentation(source)
+
+        # Slide wrappers materialized once; this class never adds or removes slides
+        self._slides_cache = list(self.presentation.slides)
+        self._slide_count = len(self._slides_cache)
+
+        self.max_workers = get_settings().modifier_workers or os.cpu_count() or 1
+
+        # Slides changed through apply(), rewritten by save_incremental()
+        self._dirty_slides: Set[int] = set()
+
+        logger.info(f"Loaded presentation: {name}")
+
+    def apply(
+        self,
+        replacements: Optional[List[AnyReplacement]] = None,
+        style_config: Optional[Union[StyleConfig, StyleConfigT]] = None,
+    ) -> None:
+        """
+        Apply content replacements and style changes in a single traversal.
+
+        Each run is visited once, applying its replacements before its styles. Large
+        workloads are spread across worker processes.
 
         Args:
-            slide_num: Slide number (0-indexed).
-            old_text: Text to replace.
-            new_text: Replacement text.
+            replacements: Text replacements to apply (optional).
+            style_config: Style configuration to apply to all slides (optional).
         """
-        if slide_num >= len(self.presentation.slides):
+        by_slide = self._group_replacements(replacements or [])
+        if isinstance(style_config, StyleConfig):
+            style_config = style_config.to_internal()
+
+        if by_slide:
+            logger.info(f"Applying {len(replacements)} content replacements")
+        if style_config is not None:
+            logger.info("Applying style modifications")
+
+        slides = self._slides_cache
+        for slide_num in [slide_num for slide_num in by_slide if slide_num >= self._slide_count]:
             logger.warning(f"Slide {slide_num} does not exist")
-            return
+            del by_slide[slide_num]
 
-        slide = self.presentation.slides[slide_num]
+        # Styles touch every slide; replacements alone only need their target slides
+        if style_config is not None:
+            targets = dict(enumerate(slides))
+        else:
+            targets = {slide_num: slides[slide_num] for slide_num in by_slide}
 
-        for shape in slide.shapes:
-            if hasattr(shape, "text_frame"):
-                self._replace_text_in_frame(shape.text_frame, old_text, new_text)
+        if len(targets) > PARALLEL_MIN_SLIDES and self.max_workers > 1:
+            try:
+                self._modify_slides_parallel(targets, by_slide, style_config)
+                return
+            except Exception as e:
+                logger.warning(f"Parallel slide modification failed, running sequentially: {e}")
 
-            # Handle tables
-            if hasattr(shape, "table"):
-                self._replace_text_in_table(shape.table, old_text, new_text)
+        styles = self._resolve_styles(style_config) if style_config is not None else None
 
-    def _replace_text_in_frame(self, text_frame, old_text: str, new_text: str) -> None:
+        for slide_num, slide in targets.items():
+            try:
+                if self._modify_slide(slide, by_slide.get(slide_num), styles):
+                    self._dirty_slides.add(slide_num)
+            except Exception as e:
+                logger.error(f"Failed to modify slide {slide_num}: {e}")
+
+    def _modify_slides_parallel(
+        self,
+        targets: Dict[int, Slide],
+        by_slide: Dict[int, List[Tuple[str, str]]],
+        style_config: Optional[StyleConfigT],
+    ) -> None:
         """
-        Replace text in a text frame while preserving formatting.
+        Modify slides in worker processes and swap the results into the presentation.
+
+        Each worker receives the serialized slide XML, so python-pptx objects never
+        cross process boundaries. Results are only applied once every slide succeeds.
 
         Args:
-            text_frame: PowerPoint text frame.
-            old_text: Text to replace.
-            new_text: Replacement text.
+            targets: Slides to modify, keyed by slide number.
+            by_slide: Replacement pairs keyed by slide number.
+            style_config: Style configuration to apply, or None.
         """
-        for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                if old_text in run.text:
-                    # Save original formatting
-                    font_name = run.font.name
-                    font_size = run.font.size
-                    font_bold = run.font.bold
-                    font_italic = run.font.italic
-                    font_color = run.font.color.rgb if run.font.color.type == 1 else None
+        slide_nums = list(targets)
+        logger.info(f"Modifying {len(slide_nums)} slides across {self.max_workers} processes")
 
-                    # Replace text
-                    run.text = run.text.replace(old_text, new_text)
+        pool = _get_process_pool(self.max_workers)
+        try:
+            results = list(
+                pool.map(
+                    _modify_slide_xml,
+                    [etree.tostring(targets[slide_num].element) for slide_num in slide_nums],
+                    [by_slide.get(slide_num) for slide_num in slide_nums],
+                    repeat(style_config),
+                    chunksize=max(1, len(slide_nums) // (self.max_workers * 4)),
+                )
+            )
+        except BrokenProcessPool:
+            # A broken pool rejects all further work, so let the next call build a new one
+            _discard_process_pool(pool)
+            raise
+
+        for slide_num, slide_xml in zip(slide_nums, results):
+            if slide_xml is None:
+                continue
 
-                    # Restore formatting
-                    if font_name:
-                        run.font.name = font_name
-                    if font_size:
-                        run.font.size = font_size
-                    if font_bold is not None:
-                        run.font.bold = font_bold
-                    if font_italic is not None:
-                        run.font.italic = font_italic
-                    if font_color:
-                        run.font.color.rgb = font_color
+            # Swap children in place so the slide part keeps its root element
+            targets[slide_num].element[:] = list(parse_xml(slide_xml))
+            self._dirty_slides.add(slide_num)
 
-    def _replace_text_in_table(self, table, old_text: str, new_text: str) -> None:
+    def replace_content(self, replacements: List[AnyReplacement]) -> None:
         """
-        Replace text in a table.
+        Replace text content in slides.
 
         Args:
-            table: PowerPoint table.
-            old_text: Text to replace.
-            new_text: Replacement text.
+            replacements: List of text replacements to apply.
         """
-        try:
-            for row in table.rows:
-                for cell in row.cells:
-                    if hasattr(cell, "text_frame"):
-                        self._replace_text_in_frame(cell.text_frame, old_text, new_text)
-        except Exception as e:
-            logger.warning(f"Failed to replace text in table: {e}")
+        self.apply(replacements=replacements)
 
-    def modify_styles(self, style_config: StyleConfig) -> None:
+    def modify_styles(self, style_config: Union[StyleConfig, StyleConfigT]) -> None:
         """
         Apply style changes to presentation.
 
         Args:
             style_config: Style configuration to apply.
         """
-        logger.info("Applying style modifications")
+        self.apply(style_config=style_config)
+
+    @classmethod
+    def _modify_slide(
+        cls,
+        slide,
+        pairs: Optional[List[Tuple[str, str]]],
+        styles: Optional[ResolvedStyles],
+    ) -> bool:
+        """
+        Apply replacements and styles to every text run in a slide.
 
-        for slide in self.presentation.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text_frame"):
-                    self._apply_styles_to_frame(shape.text_frame, style_config)
+        Args:
+            slide: PowerPoint slide.
+            pairs: (old_text, new_text) pairs to apply, or None.
+            styles: Resolved styles from _resolve_styles, or None.
 
-                # Handle tables
-                if hasattr(shape, "table"):
-                    self._apply_styles_to_table(shape.table, style_config)
+        Returns:
+            True if the slide XML was changed.
+        """
+        replacer = cls._build_replacer(pairs) if pairs else None
+        modified = False
+
+        # Work on the <a:r> elements directly rather than python-pptx's shape, paragraph
+        # and run wrappers, which are rebuilt on every property access
+        for run in _RUN_XPATH(slide.element):
+            if replacer is not None:
+                modified |= cls._replace_in_run(run, replacer)
+            if styles is not None:
+                cls._style_run(run, *styles)
+                modified = True
+
+        return modified
+
+    @staticmethod
+    def _replace_in_run(run, replacer: Replacer) -> bool:
+        """
+        Apply all replacements to a single run while preserving formatting.
 
-    def _apply_styles_to_frame(self, text_frame, style_config: StyleConfig) -> None:
+        Args:
+            run: <a:r> run element.
+            replacer: Replacer from _build_replacer.
+
+        Returns:
+            True if the run text was changed.
+        """
+        text = run.text
+        replaced = replacer(text)
+
+        # Assigning the run text only rewrites <a:t>, so <a:rPr> formatting is kept
+        if replaced == text:
+            return False
+
+        run.text = replaced
+        return True
+
+    @staticmethod
+    def _style_run(
+        run, font_name: Optional[str], font_size: Optional[Length], rgb: Optional[RGBColor]
+    ) -> None:
         """
-        Apply styles to a text frame.
+        Apply resolved styles to a single run.
 
         Args:
-            text_frame: PowerPoint text frame.
-            style_config: Style configuration.
+            run: <a:r> run element.
+            font_name: Font name, or None to keep the current one.
+            font_size: Font size, or None to keep the current one.
+            rgb: Text color, or None to keep the current one.
         """
-        for paragraph in text_frame.paragraphs:
-            for run in paragraph.runs:
-                # Apply font name
-                if style_config.font_name:
-                    run.font.name = style_config.font_name
+        font = Font(run.get_or_add_rPr())
 
-                # Apply font size
-                if style_config.font_size:
-                    run.font.size = Pt(style_config.font_size)
+        # Apply font name
+        if font_name:
+            font.name = font_name
 
-                # Apply colors
-                if style_config.color_scheme and style_config.color_scheme.text_color:
-                    rgb = self._hex_to_rgb(style_config.color_scheme.text_color)
-                    run.font.color.rgb = RGBColor(*rgb)
+        # Apply font size
+        if font_size:
+            font.size = font_size
 
-    def _apply_styles_to_table(self, table, style_config: StyleConfig) -> None:
+        # Apply colors
+        if rgb is not None:
+            font.color.rgb = rgb
+
+    @staticmethod
+    def _group_replacements(
+        replacements: List[AnyReplacement],
+    ) -> Dict[int, List[Tuple[str, str]]]:
         """
-        Apply styles to a table.
+        Group replacements by slide as (old_text, new_text) pairs.
 
         Args:
-            table: PowerPoint table.
-            style_config: Style configuration.
+            replacements: Text replacements to group.
+
+        Returns:
+            Mapping of slide number to its replacement pairs, in input order.
         """
-        try:
-            for row in table.rows:
-                for cell in row.cells:
-                    if hasattr(cell, "text_frame"):
-                        self._apply_styles_to_frame(cell.text_frame, style_config)
-        except Exception as e:
-            logger.warning(f"Failed to apply styles to table: {e}")
+        by_slide: Dict[int, List[Tuple[str, str]]] = defaultdict(list)
+        for replacement in replacements:
+            by_slide[replacement.slide_num].append((replacement.old_text, replacement.new_text))
+
+        return by_slide
+
+    @classmethod
+    def _resolve_styles(cls, style_config: StyleConfigT) -> ResolvedStyles:
+        """
+        Snapshot style values once so runs can be styled without touching the model.
+
+        Args:
+            style_config: Style configuration to resolve.
+
+        Returns:
+            (font_name, font_size, rgb) tuple; unset values are None.
+        """
+        font_size = None
+        if style_config.font_size:
+            font_size = _PT_SIZES.get(style_config.font_size) or Pt(style_config.font_size)
+
+        rgb = _rgb(*cls._hex_to_rgb(style_config.text_color)) if style_config.text_color else None
+
+        return style_config.font_name, font_size, rgb
+
+    @classmethod
+    def _build_replacer(cls, pairs: List[Tuple[str, str]]) -> Replacer:
+        """
+        Build a function applying every replacement to a text in a single pass.
+
+        Matches are leftmost-longest and non-overlapping; for duplicate old_text values
+        the first replacement wins.
+
+        Args:
+            pairs: (old_text, new_text) pairs to apply.
+
+        Returns:
+            Function mapping a text to its replaced text.
+        """
+        mapping: Dict[str, str] = {}
+        for old_text, new_text in pairs:
+            if old_text:
+                mapping.setdefault(old_text, new_text)
+
+        if not mapping:
+            return str
+
+        if len(mapping) == 1:
+            ((old_text, new_text),) = mapping.items()
+            return lambda text: text.replace(old_text, new_text)
+
+        if ahocorasick is not None and len(mapping) >= AHO_CORASICK_MIN_PATTERNS:
+            return partial(cls._replace_with_automaton, automaton=cls._build_automaton(mapping))
 
-    def _hex_to_rgb(self, hex_color: str) -> tuple:
+        # Longest first so the alternation prefers the longest match at each position
+        pattern = re.compile(
+            "|".join(re.escape(old_text) for old_text in sorted(mapping, key=len, reverse=True))
+        )
+        return partial(pattern.sub, lambda match: mapping[match.group(0)])
+
+    @staticmethod
+    def _build_automaton(mapping: Dict[str, str]):
+        """
+        Build an Aho-Corasick automaton matching every old_text at once.
+
+        Args:
+            mapping: Replacement text keyed by old_text.
+
+        Returns:
+            Automaton mapping each old_text to its (old_text, new_text) pair.
+        """
+        automaton = ahocorasick.Automaton()
+        for old_text, new_text in mapping.items():
+            automaton.add_word(old_text, (old_text, new_text))
+        automaton.make_automaton()
+
+        return automaton
+
+    @staticmethod
+    def _replace_with_automaton(text: str, automaton) -> str:
+        """
+        Replace all matches in one pass, preferring leftmost-longest non-overlapping matches.
+
+        Args:
+            text: Text to rewrite.
+            automaton: Aho-Corasick automaton built by _build_automaton.
+
+        Returns:
+            Rewritten text.
+        """
+        matches = sorted(
+            (end - len(old_text) + 1, -len(old_text), old_text, new_text)
+            for end, (old_text, new_text) in automaton.iter(text)
+        )
+        if not matches:
+            return text
+
+        parts = []
+        pos = 0
+        for start, _, old_text, new_text in matches:
+            # Skip matches overlapping one already replaced
+            if start < pos:
+                continue
+            parts.append(text[pos:start])
+            parts.append(new_text)
+            pos = start + len(old_text)
+        parts.append(text[pos:])
+
+        return "".join(parts)
+
+    @staticmethod
+    @lru_cache(maxsize=64)
+    def _hex_to_rgb(hex_color: str) -> tuple:
         """
         Convert hex color to RGB tuple.
 
@@ -189,15 +448,14 @@ class PPTModifier:
         Returns:
             RGB tuple (r, g, b).
         """
-        hex_color = hex_color.lstrip("#")
-        return tuple(int(hex_color[i : i + 2], 16) for i in (0, 2, 4))
+        return tuple(bytes.fromhex(hex_color.lstrip("#"))[:3])
 
-    def save(self, output_path: str) -> None:
+    def save(self, output_path: Union[str, IO[bytes]]) -> None:
         """
         Save modified presentation.
 
         Args:
-            output_path: Path where to save the presentation.
+            output_path: Path or writable binary file object to save the presentation to.
         """
         try:
             self.presentation.save(output_path)
@@ -206,6 +464,43 @@ class PPTModifier:
             logger.error(f"Failed to save presentation: {e}")
             raise
 
+    def save_incremental(self, output_path: Union[str, IO[bytes]]) -> None:
+        """
+        Save modified presentation, re-serializing only the slides changed by apply().
+
+        Every other part is copied from the original package instead of going through
+        a full Presentation.save(). Use save() if the presentation was changed by any
+        other means.
+
+        Args:
+            output_path: Path or writable binary file object to save the presentation to.
+        """
+        try:
+            with zipfile.ZipFile(self._source) as source, zipfile.ZipFile(
+                output_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1
+            ) as target:
+                # python-pptx renames slide parts in memory to match slide order, so
+                # resolve the entry names from the source package instead
+                part_names = get_slide_part_names(source)
+                dirty_parts = {part_names[slide_num]: slide_num for slide_num in self._dirty_slides}
+
+                for info in source.infolist():
+                    slide_num = dirty_parts.get(info.filename)
+                    if slide_num is None:
+                        data = source.read(info)
+                    else:
+                        data = serialize_part_xml(self._slides_cache[slide_num].element)
+
+                    target.writestr(info.filename, data, compress_type=info.compress_type)
+
+            logger.info(
+                f"Saved modified presentation to: {output_path} "
+                f"({len(dirty_parts)} slides rewritten)"
+            )
+        except Exception as e:
+            logger.error(f"Failed to save presentation: {e}")
+            raise
+
     def get_slide_count(self) -> int:
         """
         Get number of slides in presentation.
@@ -213,4 +508,94 @@ class PPTModifier:
         Returns:
             Number of slides.
         """
-        return len(self.presentation.slides)
+        return self._slide_count
+
+
+def _rgb(r: int, g: int, b: int) -> RGBColor:
+    """
+    Get the interned RGBColor for a color.
+
+    Args:
+        r: Red component (0-255).
+        g: Green component (0-255).
+        b: Blue component (0-255).
+
+    Returns:
+        Shared RGBColor instance.
+    """
+    key = (r, g, b)
+    rgb = _RGB_CACHE.get(key)
+    if rgb is None:
+        rgb = _RGB_CACHE[key] = RGBColor(r, g, b)
+
+    return rgb
+
+
+def _modify_slide_xml(
+    slide_xml: bytes,
+    pairs: Optional[List[Tuple[str, str]]],
+    style_config: Optional[StyleConfigT],
+) -> Optional[bytes]:
+    """
+    Apply replacements and styles to a serialized slide in a worker process.
+
+    Args:
+        slide_xml: Serialized <p:sld> element.
+        pairs: (old_text, new_text) pairs to apply, or None.
+        style_config: Style configuration to apply, or None.
+
+    Returns:
+        Serialized modified <p:sld> element, or None if nothing changed.
+    """
+    # Text and font changes only touch the slide XML, so no package part is needed
+    slide = Slide(parse_xml(slide_xml), None)
+    styles = PPTModifier._resolve_styles(style_config) if style_config is not None else None
+
+    if not PPTModifier._modify_slide(slide, pairs, styles):
+        return None
+
+    return etree.tostring(slide.element)
+
+
+# Shared worker pool (lazy-loaded)
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Get the shared process pool for slide modification.
+
+    Args:
+        max_workers: Number of worker processes when the pool is first created.
+
+    Returns:
+        Process pool executor.
+    """
+    global _process_pool
+
+    if _process_pool is None:
+        with _process_pool_lock:
+            if _process_pool is None:
+                # Spawn rather than fork, the parent may hold model and thread state
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+                )
+
+    return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """
+    Shut down a shared process pool and drop it if it is still the current one.
+
+    Args:
+        pool: Pool to discard.
+    """
+    global _process_pool
+
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+
+    pool.shutdown(wait=False, cancel_futures=True)
@@ -1,5 +1,6 @@
 """Data models for PowerPoint operations."""
 
+from dataclasses import dataclass
 from typing import List, Optional
 
 from pydantic import BaseModel, Field
@@ -83,6 +84,24 @@ class Replacement(BaseModel):
             }
         }
 
+    def to_internal(self) -> "ReplacementT":
+        """
+        Convert to the lightweight internal representation.
+
+        Returns:
+            Equivalent ReplacementT.
+        """
+        return ReplacementT(self.slide_num, self.old_text, self.new_text)
+
+
+@dataclass(slots=True, frozen=True)
+class ReplacementT:
+    """Internal text replacement instruction used inside slide traversals."""
+
+    slide_num: int
+    old_text: str
+    new_text: str
+
 
 class ColorScheme(BaseModel):
     """Color scheme for PowerPoint styling."""
@@ -109,3 +128,22 @@ class StyleConfig(BaseModel):
                 "color_scheme": {"text_color": "#000000"},
             }
         }
+
+    def to_internal(self) -> "StyleConfigT":
+        """
+        Convert to the lightweight internal representation.
+
+        Returns:
+            Equivalent StyleConfigT with the text color flattened out of the color scheme.
+        """
+        text_color = self.color_scheme.text_color if self.color_scheme else None
+        return StyleConfigT(self.font_name, self.font_size, text_color)
+
+
+@dataclass(slots=True, frozen=True)
+class StyleConfigT:
+    """Internal style configuration used inside slide traversals."""
+
+    font_name: Optional[str] = None
+    font_size: Optional[int] = None
+    text_color: Optional[str] = None
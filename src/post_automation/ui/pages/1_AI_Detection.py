@@ -1,14 +1,66 @@
 """AI Detection Streamlit page."""
 
+from typing import List
+
 import streamlit as st
 
 from post_automation.core.ai_detector import get_detector
 from post_automation.core.ppt_analyzer import PPTAnalyzer
-from post_automation.utils.file_handler import cleanup_file, save_uploaded_file
+from post_automation.models.detection import DetectionResult
 from post_automation.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+
+@st.cache_data(show_spinner=False)
+def _analyze_text(text: str) -> DetectionResult:
+    """
+    Run AI detection on text, cached across reruns.
+
+    Args:
+        text: Text to analyze.
+
+    Returns:
+        Detection result.
+    """
+    return get_detector().detect(text)
+
+
+@st.cache_data(show_spinner=False)
+def _analyze_pptx(file_bytes: bytes, file_name: str) -> List[dict]:
+    """
+    Extract slide text and run AI detection on each slide, cached by file contents.
+
+    Args:
+        file_bytes: Uploaded PowerPoint file content.
+        file_name: Original filename.
+
+    Returns:
+        Per-slide results with slide number, text and detection (None for empty slides).
+    """
+    # Parse the upload in memory rather than round-tripping it through a temp file
+    slides_text = PPTAnalyzer().extract_text_from_bytes(file_bytes, file_name)
+
+    # Detect AI on all non-empty slides in one batch; empty slides skip inference
+    nonempty = [slide_text for slide_text in slides_text if slide_text.text.strip()]
+    detections = get_detector().detect_batch([slide_text.text for slide_text in nonempty])
+    detection_by_slide = {
+        slide_text.slide_number: detection
+        for slide_text, detection in zip(nonempty, detections)
+    }
+
+    slide_results = []
+    for slide_text in slides_text:
+        detection = detection_by_slide.get(slide_text.slide_number)
+        slide_results.append({
+            "slide_num": slide_text.slide_number,
+            "text": slide_text.text if detection is not None else "(Empty slide)",
+            "detection": detection
+        })
+
+    return slide_results
+
+
 st.set_page_config(page_title="AI Detection", page_icon="🔍", layout="wide")
 
 st.title("🔍 AI Content Detection")
@@ -37,9 +89,8 @@ if detection_mode == "Text Input":
         if text_input and len(text_input.strip()) >= 10:
             with st.spinner("Analyzing text..."):
                 try:
-                    # Get detector and run analysis
-                    detector = get_detector()
-                    result = detector.detect(text_input)
+                    # Run analysis (cached for previously analyzed text)
+                    result = _analyze_text(text_input)
 
                     # Display results
                     st.success("Analysis Complete!")
@@ -94,39 +145,15 @@ else:  # PowerPoint File mode
 
     if uploaded_file is not None:
         if st.button("🔍 Analyze Presentation", type="primary", use_container_width=True):
-            temp_path = None
-
             with st.spinner("Analyzing presentation..."):
                 try:
-                    # Save uploaded file
-                    file_content = uploaded_file.read()
-                    temp_path = save_uploaded_file(file_content, uploaded_file.name)
-
-                    # Extract text from slides
-                    analyzer = PPTAnalyzer()
-                    slides_text = analyzer.extract_text_from_pptx(temp_path)
-
-                    # Detect AI in each slide
-                    detector = get_detector()
-                    ai_count = 0
-                    slide_results = []
-
-                    for slide_text in slides_text:
-                        if slide_text.text.strip():
-                            detection = detector.detect(slide_text.text)
-                            if detection.is_ai_generated:
-                                ai_count += 1
-                            slide_results.append({
-                                "slide_num": slide_text.slide_number,
-                                "text": slide_text.text,
-                                "detection": detection
-                            })
-                        else:
-                            slide_results.append({
-                                "slide_num": slide_text.slide_number,
-                                "text": "(Empty slide)",
-                                "detection": None
-                            })
+                    # Extract and analyze slides (cached for previously analyzed files)
+                    slide_results = _analyze_pptx(uploaded_file.getvalue(), uploaded_file.name)
+                    ai_count = sum(
+                        1
+                        for result in slide_results
+                        if result["detection"] and result["detection"].is_ai_generated
+                    )
 
                     # Display overall results
                     st.success("Analysis Complete!")
@@ -134,13 +161,13 @@ else:  # PowerPoint File mode
                     col1, col2, col3 = st.columns(3)
 
                     with col1:
-                        st.metric("Total Slides", len(slides_text))
+                        st.metric("Total Slides", len(slide_results))
 
                     with col2:
                         st.metric("AI-Generated", ai_count)
 
                     with col3:
-                        st.metric("Human-Written", len(slides_text) - ai_count)
+                        st.metric("Human-Written", len(slide_results) - ai_count)
 
                     # Display per-slide results
                     st.markdown("### 📄 Slide-by-Slide Results")
@@ -176,9 +203,6 @@ else:  # PowerPoint File mode
                 except Exception as e:
                     st.error(f"Error during analysis: {str(e)}")
                     logger.error(f"PPTX detection error: {e}")
-                finally:
-                    if temp_path:
-                        cleanup_file(temp_path)
 
 # Sidebar info
 with st.sidebar:
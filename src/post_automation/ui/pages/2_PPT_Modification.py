@@ -1,17 +1,88 @@
 """PowerPoint Modification Streamlit page."""
 
+import hashlib
+import io
+import os
+from typing import List, Optional, Tuple
+
 import streamlit as st
 
 from post_automation.core.ai_detector import get_detector
 from post_automation.core.content_generator import ContentGenerator
 from post_automation.core.ppt_analyzer import PPTAnalyzer
 from post_automation.core.ppt_modifier import PPTModifier
-from post_automation.models.ppt import ColorScheme, Replacement, StyleConfig
-from post_automation.utils.file_handler import cleanup_file, generate_temp_filename, save_uploaded_file
+from post_automation.models.ppt import ReplacementT, StyleConfigT
+from post_automation.utils.config import get_settings
 from post_automation.utils.logger import setup_logger
 
+try:
+    import diskcache
+except ImportError:  # Optional dependency, results are only cached per session without it
+    diskcache = None
+
 logger = setup_logger(__name__)
 
+
+@st.cache_resource(show_spinner=False)
+def _get_disk_cache():
+    """
+    Get the persistent cache of (is_ai_generated, confidence) detection results.
+
+    Opened once per process and shared across sessions and reruns.
+
+    Returns:
+        Disk cache, or None if diskcache is not installed.
+    """
+    if diskcache is None:
+        return None
+
+    return diskcache.Cache(os.path.join(get_settings().temp_dir, "det_cache"))
+
+
+@st.cache_data(show_spinner=False)
+def _rewrite_ai_texts(texts: Tuple[str, ...], confidence_threshold: float) -> List[Optional[str]]:
+    """
+    Detect AI content and generate alternatives, cached by slide contents.
+
+    Only detection results are cached on disk. Alternatives are generated on
+    every call, so they always follow the current replacement rules.
+
+    Args:
+        texts: Non-empty slide texts.
+        confidence_threshold: Minimum AI confidence for a text to be replaced.
+
+    Returns:
+        Replacement text for each input, or None if it should be kept.
+    """
+    model_name = get_settings().hf_model_name
+    keys = [
+        hashlib.blake2b(f"detection\0{model_name}\0{text}".encode(), digest_size=16).hexdigest()
+        for text in texts
+    ]
+    disk_cache = _get_disk_cache()
+    detections = [disk_cache.get(key) if disk_cache is not None else None for key in keys]
+
+    # Only texts missing from the persistent cache go through the model
+    missing = [i for i, detection in enumerate(detections) if detection is None]
+    if missing:
+        results = get_detector().detect_batch([texts[i] for i in missing])
+        for i, result in zip(missing, results):
+            detections[i] = (result.is_ai_generated, result.confidence)
+            if disk_cache is not None:
+                disk_cache.set(keys[i], detections[i])
+
+    # Generate alternatives for all flagged texts in one batch
+    flagged = [
+        i
+        for i, (is_ai_generated, confidence) in enumerate(detections)
+        if is_ai_generated and confidence >= confidence_threshold
+    ]
+    generated = ContentGenerator().generate_batch([texts[i] for i in flagged])
+    new_texts = dict(zip(flagged, generated))
+
+    return [new_texts.get(i) for i in range(len(texts))]
+
+
 st.set_page_config(page_title="PPT Modification", page_icon="📝", layout="wide")
 
 st.title("📝 PowerPoint Modification")
@@ -88,83 +159,76 @@ if uploaded_file is not None:
 
     # Modify button
     if st.button("🚀 Modify Presentation", type="primary", use_container_width=True):
-        temp_input = None
-        temp_output = None
-
         with st.spinner("Modifying presentation..."):
             try:
-                # Save uploaded file
-                file_content = uploaded_file.read()
-                temp_input = save_uploaded_file(file_content, uploaded_file.name)
-
-                # Initialize components
+                # Load the uploaded file once; text extraction reuses the same presentation.
+                # getvalue() shares the upload buffer and ignores the read position
+                file_content = uploaded_file.getvalue()
                 analyzer = PPTAnalyzer()
-                modifier = PPTModifier(temp_input)
+                modifier = PPTModifier.from_bytes(file_content, uploaded_file.name)
 
+                # Status text is the progress bar's label, so each step is one UI update
                 progress_bar = st.progress(0)
-                status_text = st.empty()
 
-                # Step 1: Replace AI content
+                # Step 1: Generate replacements for AI content
+                replacements = []
                 if replace_ai:
-                    status_text.text("Detecting AI content...")
-                    progress_bar.progress(20)
-
-                    slides_text = analyzer.extract_text_from_pptx(temp_input)
-                    detector = get_detector()
-                    generator = ContentGenerator()
+                    progress_bar.progress(20, text="Detecting AI content...")
 
-                    replacements = []
-                    for slide_text in slides_text:
-                        if not slide_text.text.strip():
-                            continue
+                    slides_text = analyzer.iter_presentation_texts(modifier.presentation)
 
-                        detection = detector.detect(slide_text.text)
+                    # Detect AI on all non-empty slides in one batch, reusing earlier results
+                    slides_text = [
+                        slide_text for slide_text in slides_text if slide_text.text.strip()
+                    ]
+                    new_texts = _rewrite_ai_texts(
+                        tuple(slide_text.text for slide_text in slides_text), confidence_threshold
+                    )
 
-                        if detection.is_ai_generated and detection.confidence >= confidence_threshold:
-                            new_text = generator.generate(slide_text.text)
+                    for slide_text, new_text in zip(slides_text, new_texts):
+                        if new_text is not None:
                             replacements.append(
-                                Replacement(
+                                ReplacementT(
                                     slide_num=slide_text.slide_number,
                                     old_text=slide_text.text,
                                     new_text=new_text
                                 )
                             )
 
-                    if replacements:
-                        status_text.text(f"Replacing {len(replacements)} AI-detected slides...")
-                        progress_bar.progress(50)
-                        modifier.replace_content(replacements)
-                        st.info(f"✅ Replaced content in {len(replacements)} slides")
-                    else:
+                    if not replacements:
                         st.warning("No AI-detected content found above the threshold")
 
-                # Step 2: Apply styles
+                # Step 2: Build style changes
+                style_config = None
                 if apply_styles:
-                    status_text.text("Applying style changes...")
-                    progress_bar.progress(70)
-
-                    color_scheme = ColorScheme(text_color=text_color) if text_color else None
-                    style_config = StyleConfig(
+                    style_config = StyleConfigT(
                         font_name=font_name,
-                        color_scheme=color_scheme
+                        text_color=text_color or None
                     )
 
-                    modifier.modify_styles(style_config)
-                    st.info(f"✅ Applied style changes: Font={font_name}, Color={text_color}")
+                # Apply replacements and styles in a single pass over the slides
+                if replacements or style_config is not None:
+                    progress_bar.progress(60, text="Applying modifications...")
+                    modifier.apply(replacements, style_config)
+
+                    if replacements:
+                        st.info(f"✅ Replaced content in {len(replacements)} slides")
+                    if style_config is not None:
+                        st.info(f"✅ Applied style changes: Font={font_name}, Color={text_color}")
 
                 # Step 3: Save modified presentation
-                status_text.text("Saving modified presentation...")
-                progress_bar.progress(90)
+                progress_bar.progress(90, text="Saving modified presentation...")
 
-                temp_output = generate_temp_filename(".pptx")
-                modifier.save(temp_output)
+                # Save in memory; the download needs the content, not a file on disk
+                output = io.BytesIO()
+                modifier.save_incremental(output)
 
-                progress_bar.progress(100)
-                status_text.text("✅ Modification complete!")
+                # Drop the parsed presentation so it is not held while the download is
+                # built. getvalue() shares the buffer rather than copying it.
+                del modifier
+                modified_content = output.getvalue()
 
-                # Download button
-                with open(temp_output, "rb") as f:
-                    modified_content = f.read()
+                progress_bar.progress(100, text="✅ Modification complete!")
 
                 st.success("Presentation modified successfully!")
 
@@ -179,11 +243,6 @@ if uploaded_file is not None:
             except Exception as e:
                 st.error(f"Error during modification: {str(e)}")
                 logger.error(f"PPT modification error: {e}")
-            finally:
-                if temp_input:
-                    cleanup_file(temp_input)
-                if temp_output:
-                    cleanup_file(temp_output)
 
 # Sidebar info
 with st.sidebar:
@@ -1,7 +1,8 @@
 """Configuration management using pydantic-settings."""
 
-from functools import lru_cache
-from typing import List
+from functools import cache, cached_property
+from pathlib import Path
+from typing import Any, FrozenSet, List
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -17,6 +18,19 @@ class Settings(BaseSettings):
     hf_model_name: str = Field(
         default="roberta-base-openai-detector", description="HuggingFace model for AI detection"
     )
+    detector_backend: str = Field(
+        default="torch", description="Detector inference backend (torch or onnx)"
+    )
+    detector_cache_size: int = Field(
+        default=1024, description="Maximum number of cached detection results (0 disables)"
+    )
+    detector_compile: bool = Field(
+        default=False, description="Compile the torch detector model with torch.compile"
+    )
+    detector_precision: str = Field(
+        default="fp32",
+        description="Detector inference precision (fp32, fp16 on CUDA, int8 on CPU)",
+    )
 
     # API Configuration
     api_host: str = Field(default="0.0.0.0", description="FastAPI host")
@@ -24,6 +38,18 @@ class Settings(BaseSettings):
     api_workers: int = Field(default=4, description="Number of API workers")
     api_reload: bool = Field(default=False, description="Enable auto-reload")
 
+    # Detection Batching Configuration
+    batch_size: int = Field(default=32, description="Maximum texts per batched detection call")
+    batch_timeout_ms: float = Field(
+        default=10.0, description="Maximum wait for a detection batch to fill (ms)"
+    )
+
+    # PowerPoint Modification Configuration
+    modifier_workers: int = Field(
+        default=1,
+        description="Worker processes for modifying large decks (1 disables, 0 = CPU count)",
+    )
+
     # Streamlit Configuration
     streamlit_port: int = Field(default=8501, description="Streamlit port")
     streamlit_server_address: str = Field(default="0.0.0.0", description="Streamlit server address")
@@ -42,23 +68,61 @@ class Settings(BaseSettings):
     # Temp File Storage
     temp_dir: str = Field(default="/tmp/post-automation", description="Temporary file directory")
 
+    def model_post_init(self, __context: Any) -> None:
+        """Compute the derived values once, when the settings are loaded."""
+        for name in ("cors_origins_list", "allowed_extensions", "temp_path"):
+            getattr(self, name)
+
     @property
     def max_upload_size_bytes(self) -> int:
         """Get maximum upload size in bytes."""
         return self.max_upload_size_mb * 1024 * 1024
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
         """Get CORS origins as a list."""
         return [origin.strip() for origin in self.cors_origins.split(",")]
 
-    @property
+    @cached_property
     def allowed_extensions_list(self) -> List[str]:
         """Get allowed PowerPoint extensions as a list."""
         return [ext.strip() for ext in self.allowed_ppt_extensions.split(",")]
 
+    @cached_property
+    def allowed_extensions(self) -> FrozenSet[str]:
+        """Get lowercased allowed PowerPoint extensions for membership checks."""
+        return frozenset(ext.lower() for ext in self.allowed_extensions_list)
+
+    @cached_property
+    def temp_path(self) -> Path:
+        """Get temporary file directory as a path."""
+        return Path(self.temp_dir)
+
 
-@lru_cache()
+@cache
 def get_settings() -> Settings:
     """Get cached settings instance."""
     return Settings()
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Create the module-level ``SETTINGS`` instance on first access.
+
+    Importing this module never loads the settings by itself; after the first
+    access ``SETTINGS`` is a plain module attribute.
+
+    Args:
+        name: Attribute name.
+
+    Returns:
+        Settings instance for ``SETTINGS``.
+
+    Raises:
+        AttributeError: For any other missing attribute.
+    """
+    if name == "SETTINGS":
+        settings = globals()["SETTINGS"] = get_settings()
+        return settings
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,15 +1,28 @@
 """File handling utilities."""
 
+import itertools
 import os
-import uuid
+import secrets
+import shutil
 from pathlib import Path
-from typing import BinaryIO
+from typing import Optional, Tuple
 
-from post_automation.utils.config import get_settings
+import aiofiles
+
+from post_automation.utils.config import SETTINGS
 from post_automation.utils.logger import setup_logger
+from post_automation.utils.validators import validate_file_size
 
 logger = setup_logger(__name__)
 
+# Chunk size for streaming uploads to disk (1 MB)
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Temp filenames are a random per-import prefix, the process ID and a counter,
+# so they stay unique without drawing fresh randomness for every file
+_temp_prefix = secrets.token_hex(4)
+_temp_counter = itertools.count()
+
 
 def ensure_temp_dir() -> Path:
     """
@@ -18,48 +31,95 @@ def ensure_temp_dir() -> Path:
     Returns:
         Path to temporary directory.
     """
-    settings = get_settings()
-    temp_dir = Path(settings.temp_dir)
+    temp_dir = SETTINGS.temp_path
     temp_dir.mkdir(parents=True, exist_ok=True)
     return temp_dir
 
 
-def generate_temp_filename(extension: str = ".pptx") -> str:
+def generate_temp_filename(extension: str = ".pptx", directory: Optional[str] = None) -> str:
     """
     Generate a unique temporary filename.
 
     Args:
         extension: File extension (default: .pptx).
+        directory: Directory for the file. If None, uses the temporary directory.
 
     Returns:
         Full path to temporary file.
     """
-    temp_dir = ensure_temp_dir()
-    filename = f"{uuid.uuid4()}{extension}"
+    temp_dir = Path(directory) if directory else ensure_temp_dir()
+    filename = f"{_temp_prefix}_{os.getpid()}_{next(_temp_counter)}{extension}"
     return str(temp_dir / filename)
 
 
-def save_uploaded_file(file_content: bytes, original_filename: str) -> str:
+def create_request_dir() -> str:
+    """
+    Create a unique subdirectory of the temporary directory for one request.
+
+    All temporary files of a request can be placed in it and removed together
+    with ``cleanup_dir``.
+
+    Returns:
+        Path to the created directory.
     """
-    Save uploaded file to temporary directory.
+    request_dir = generate_temp_filename("")
+    os.mkdir(request_dir)
+    return request_dir
+
+
+def _owner_only_opener(path: str, flags: int) -> int:
+    """
+    Open a file, creating it readable and writable only by the owner.
 
     Args:
-        file_content: File content as bytes.
-        original_filename: Original filename.
+        path: Path to the file.
+        flags: Flags for ``os.open``.
 
     Returns:
-        Path to saved file.
+        File descriptor.
     """
-    # Get file extension
-    ext = Path(original_filename).suffix
-    temp_path = generate_temp_filename(ext)
+    return os.open(path, flags, 0o600)
 
-    # Save file
-    with open(temp_path, "wb") as f:
-        f.write(file_content)
 
-    logger.info(f"Saved uploaded file to {temp_path}")
-    return temp_path
+async def save_upload_stream(
+    upload, original_filename: str, directory: Optional[str] = None
+) -> Tuple[str, int]:
+    """
+    Stream an uploaded file to the temporary directory in chunks.
+
+    The upload is never held in memory as a whole, only one chunk at a time,
+    and streaming stops as soon as the maximum upload size is exceeded.
+
+    Args:
+        upload: Uploaded file with an async ``read(size)`` method.
+        original_filename: Original filename.
+        directory: Directory to save into. If None, uses the temporary directory.
+
+    Returns:
+        Tuple of path to saved file and its size in bytes.
+
+    Raises:
+        ValidationError: If the upload exceeds the maximum allowed size.
+    """
+    ext = os.path.splitext(original_filename)[1]
+    temp_path = generate_temp_filename(ext, directory)
+    total_size = 0
+
+    try:
+        # Readable only by the owner, writing to disk in 1 MB blocks
+        async with aiofiles.open(
+            temp_path, "wb", buffering=UPLOAD_CHUNK_SIZE, opener=_owner_only_opener
+        ) as f:
+            while chunk := await upload.read(UPLOAD_CHUNK_SIZE):
+                total_size += len(chunk)
+                validate_file_size(total_size)
+                await f.write(chunk)
+    except Exception:
+        cleanup_file(temp_path)
+        raise
+
+    logger.info(f"Streamed uploaded file to {temp_path} ({total_size} bytes)")
+    return temp_path, total_size
 
 
 def validate_file_extension(filename: str) -> bool:
@@ -72,9 +132,8 @@ def validate_file_extension(filename: str) -> bool:
     Returns:
         True if extension is allowed, False otherwise.
     """
-    settings = get_settings()
-    ext = Path(filename).suffix.lower()
-    return ext in settings.allowed_extensions_list
+    ext = os.path.splitext(filename)[1].lower()
+    return ext in SETTINGS.allowed_extensions
 
 
 def cleanup_file(file_path: str) -> None:
@@ -85,8 +144,25 @@ def cleanup_file(file_path: str) -> None:
         file_path: Path to file to delete.
     """
     try:
-        if os.path.exists(file_path):
-            os.remove(file_path)
-            logger.info(f"Cleaned up file: {file_path}")
-    except Exception as e:
+        os.unlink(file_path)
+        logger.info(f"Cleaned up file: {file_path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
         logger.error(f"Failed to cleanup file {file_path}: {e}")
+
+
+def cleanup_dir(dir_path: str) -> None:
+    """
+    Delete a directory and everything in it if it exists.
+
+    Args:
+        dir_path: Path to directory to delete.
+    """
+    try:
+        shutil.rmtree(dir_path)
+        logger.info(f"Cleaned up directory: {dir_path}")
+    except FileNotFoundError:
+        pass
+    except OSError as e:
+        logger.error(f"Failed to cleanup directory {dir_path}: {e}")
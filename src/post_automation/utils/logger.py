@@ -2,15 +2,93 @@
 
 import logging
 import sys
+from functools import lru_cache
 from typing import Optional
 
+import orjson
+
 from post_automation.utils.config import get_settings
 
+# Name marking the console handler attached by setup_logger
+HANDLER_NAME = "post_automation_default"
+
+
+class JsonFormatter(logging.Formatter):
+    """Formatter emitting each record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        """
+        Format a record as JSON.
+
+        Args:
+            record: Log record to format.
+
+        Returns:
+            JSON object with timestamp, level, logger and message fields, plus the
+            formatted traceback when the record carries exception info.
+        """
+        entry = {
+            "timestamp": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+
+        return orjson.dumps(entry).decode()
+
+
+def _build_formatter() -> logging.Formatter:
+    """
+    Build the log formatter for the configured log format.
+
+    Returns:
+        Formatter instance.
+    """
+    if get_settings().log_format == "json":
+        return JsonFormatter()
+
+    return logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M:%S",
+    )
 
+
+# Shared by every handler setup_logger attaches
+_formatter = _build_formatter()
+
+
+def _has_default_handler(logger: logging.Logger) -> bool:
+    """
+    Check whether a logger's records already reach a setup_logger handler.
+
+    Args:
+        logger: Logger to check, along with the ancestors it propagates to.
+
+    Returns:
+        True if the logger or a propagated-to ancestor has the handler.
+    """
+    current = logger
+    while current is not None:
+        if any(handler.get_name() == HANDLER_NAME for handler in current.handlers):
+            return True
+        if not current.propagate:
+            break
+        current = current.parent
+
+    return False
+
+
+@lru_cache(maxsize=None)
 def setup_logger(name: Optional[str] = None) -> logging.Logger:
     """
     Set up and configure a logger.
 
+    Repeated calls for the same name return the configured logger. A console
+    handler is only attached if the logger's records do not already reach one
+    through a parent, and handlers added by other libraries are left in place.
+
     Args:
         name: Logger name. If None, uses root logger.
 
@@ -24,26 +102,14 @@ def setup_logger(name: Optional[str] = None) -> logging.Logger:
     log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
     logger.setLevel(log_level)
 
-    # Remove existing handlers
-    logger.handlers.clear()
+    if _has_default_handler(logger):
+        return logger
 
     # Create console handler
     handler = logging.StreamHandler(sys.stdout)
+    handler.set_name(HANDLER_NAME)
     handler.setLevel(log_level)
-
-    # Create formatter
-    if settings.log_format == "json":
-        formatter = logging.Formatter(
-            '{"timestamp": "%(asctime)s", "level": "%(levelname)s", '
-            '"logger": "%(name)s", "message": "%(message)s"}'
-        )
-    else:
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S",
-        )
-
-    handler.setFormatter(formatter)
+    handler.setFormatter(_formatter)
     logger.addHandler(handler)
 
     return logger
@@ -0,0 +1,37 @@
+"""Timestamp helpers for API responses."""
+
+import time
+from datetime import datetime, timezone
+
+# Last formatted timestamp and the wall-clock second it was formatted for
+_cached_second = -1
+_cached_timestamp = ""
+
+
+def utc_timestamp() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string.
+
+    Returns:
+        Timestamp with second resolution, e.g. "2025-12-23T10:30:00Z".
+    """
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def cached_utc_timestamp() -> str:
+    """
+    Get the current UTC timestamp, formatting it at most once per second.
+
+    Intended for high-frequency endpoints such as health probes.
+
+    Returns:
+        Timestamp with second resolution, e.g. "2025-12-23T10:30:00Z".
+    """
+    global _cached_second, _cached_timestamp
+
+    now = int(time.time())
+    if now != _cached_second:
+        _cached_timestamp = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))
+        _cached_second = now
+
+    return _cached_timestamp
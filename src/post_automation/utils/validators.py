@@ -1,8 +1,13 @@
 """Input validation utilities."""
 
-from pathlib import Path
+import os
+import re
+from typing import Optional
 
-from post_automation.utils.config import get_settings
+from post_automation.utils.config import SETTINGS
+
+# Leading whitespace run, matched without copying the text
+_LEADING_WHITESPACE = re.compile(r"\s*")
 
 
 class ValidationError(Exception):
@@ -21,39 +26,36 @@ def validate_file_size(file_size: int) -> None:
     Raises:
         ValidationError: If file size exceeds limit.
     """
-    settings = get_settings()
-    max_size = settings.max_upload_size_bytes
-
-    if file_size > max_size:
+    if file_size > SETTINGS.max_upload_size_bytes:
         raise ValidationError(
             f"File size ({file_size / 1024 / 1024:.2f}MB) exceeds "
-            f"maximum allowed size ({settings.max_upload_size_mb}MB)"
+            f"maximum allowed size ({SETTINGS.max_upload_size_mb}MB)"
         )
 
 
-def validate_pptx_file(filename: str, file_size: int) -> None:
+def validate_pptx_file(filename: str, file_size: Optional[int] = None) -> None:
     """
     Validate PowerPoint file.
 
     Args:
         filename: Filename to validate.
-        file_size: File size in bytes.
+        file_size: File size in bytes. If None, only the extension is checked
+            and the size is expected to be validated while streaming.
 
     Raises:
         ValidationError: If validation fails.
     """
-    settings = get_settings()
-
     # Check extension
-    ext = Path(filename).suffix.lower()
-    if ext not in settings.allowed_extensions_list:
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in SETTINGS.allowed_extensions:
         raise ValidationError(
             f"Invalid file extension '{ext}'. "
-            f"Allowed extensions: {', '.join(settings.allowed_extensions_list)}"
+            f"Allowed extensions: {', '.join(SETTINGS.allowed_extensions_list)}"
         )
 
     # Check size
-    validate_file_size(file_size)
+    if file_size is not None:
+        validate_file_size(file_size)
 
 
 def validate_text_input(text: str, min_length: int = 10, max_length: int = 100000) -> None:
@@ -68,13 +70,40 @@ def validate_text_input(text: str, min_length: int = 10, max_length: int = 10000
     Raises:
         ValidationError: If validation fails.
     """
-    if not text or not text.strip():
-        raise ValidationError("Text input cannot be empty")
+    text_length = len(text)
 
-    text_length = len(text.strip())
+    # Text starting and ending with a visible character has nothing to strip
+    if text_length and (text[0].isspace() or text[-1].isspace()):
+        text_length = _stripped_len(text)
+
+    if not text_length:
+        raise ValidationError("Text input cannot be empty")
 
     if text_length < min_length:
         raise ValidationError(f"Text must be at least {min_length} characters long")
 
     if text_length > max_length:
         raise ValidationError(f"Text must not exceed {max_length} characters")
+
+
+def _stripped_len(text: str) -> int:
+    """
+    Get the length of text without surrounding whitespace.
+
+    Equivalent to ``len(text.strip())``, but only scans the whitespace at both
+    ends instead of copying the text. The leading run is matched by the regex
+    engine, so long whitespace prefixes are skipped at C speed.
+
+    Args:
+        text: Text to measure.
+
+    Returns:
+        Length of the stripped text.
+    """
+    start = _LEADING_WHITESPACE.match(text).end()
+    end = len(text)
+
+    while end > start and text[end - 1].isspace():
+        end -= 1
+
+    return end - start
@@ -1,13 +1,70 @@
 """n8n workflow generator."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
+import orjson
+
 from post_automation.utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
+# Stands in for the API base URL in workflow templates
+API_BASE_URL_PLACEHOLDER = "__API_BASE_URL__"
+
+# n8n expression for the API base URL used by base_workflow.json
+API_BASE_URL_ENV_EXPRESSION = "={{$env.API_BASE_URL}}"
+
+# Stands in for the modification confidence threshold in base_workflow.json
+CONFIDENCE_THRESHOLD_PLACEHOLDER = "__CONFIDENCE_THRESHOLD__"
+
+# Detection-only workflow, serialized once and filled in per call
+_SIMPLE_WORKFLOW_TEMPLATE = {
+    "name": "Simple AI Detection",
+    "nodes": [
+        {
+            "parameters": {"path": "detect-ai", "responseMode": "responseNode"},
+            "id": "webhook",
+            "name": "Webhook",
+            "type": "n8n-nodes-base.webhook",
+            "typeVersion": 1,
+            "position": [250, 300],
+        },
+        {
+            "parameters": {
+                "method": "POST",
+                "url": f"{API_BASE_URL_PLACEHOLDER}/api/detect/text",
+                "sendBody": True,
+                "specifyBody": "json",
+                "jsonBody": '={{ {"text": $json.text} }}',
+            },
+            "id": "detect",
+            "name": "Detect AI",
+            "type": "n8n-nodes-base.httpRequest",
+            "typeVersion": 3,
+            "position": [450, 300],
+        },
+        {
+            "parameters": {"respondWith": "allIncomingItems"},
+            "id": "respond",
+            "name": "Respond",
+            "type": "n8n-nodes-base.respondToWebhook",
+            "typeVersion": 1,
+            "position": [650, 300],
+        },
+    ],
+    "connections": {
+        "Webhook": {"main": [[{"node": "Detect AI", "type": "main", "index": 0}]]},
+        "Detect AI": {"main": [[{"node": "Respond", "type": "main", "index": 0}]]},
+    },
+    "active": False,
+    "settings": {},
+}
+
+_SIMPLE_WORKFLOW_JSON = orjson.dumps(_SIMPLE_WORKFLOW_TEMPLATE).decode()
+
 
 class WorkflowGenerator:
     """Generator for n8n workflow JSON files."""
@@ -37,29 +94,15 @@ class WorkflowGenerator:
         """
         logger.info(f"Generating n8n workflow with API base URL: {self.api_base_url}")
 
-        # Load template
-        with open(self.template_path, "r") as f:
-            workflow = json.load(f)
-
-        # Update API URLs in workflow
-        for node in workflow.get("nodes", []):
-            if node.get("type") == "n8n-nodes-base.httpRequest":
-                params = node.get("parameters", {})
-                if "url" in params:
-                    # Replace environment variable with actual URL
-                    url = params["url"]
-                    url = url.replace("={{$env.API_BASE_URL}}", self.api_base_url)
-                    params["url"] = url
-
-                # Update confidence threshold if applicable
-                if "modify" in node.get("name", "").lower():
-                    options = params.get("options", {})
-                    query_params = options.get("queryParameters", {})
-                    params_list = query_params.get("parameters", [])
-
-                    for param in params_list:
-                        if param.get("name") == "confidence_threshold":
-                            param["value"] = str(confidence_threshold)
+        # Fill in the API URLs and the modification threshold on the template text,
+        # substituting JSON-escaped values, then parse the result once
+        url = orjson.dumps(self.api_base_url).decode()[1:-1]
+        template = self._load_template(str(self.template_path))
+        workflow = orjson.loads(
+            template.replace(API_BASE_URL_ENV_EXPRESSION, url).replace(
+                CONFIDENCE_THRESHOLD_PLACEHOLDER, str(confidence_threshold)
+            )
+        )
 
         # Save to file if path provided
         if output_path:
@@ -73,6 +116,20 @@ class WorkflowGenerator:
 
         return workflow
 
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def _load_template(template_path: str) -> str:
+        """
+        Load a workflow template, cached by path.
+
+        Args:
+            template_path: Path to the template JSON file.
+
+        Returns:
+            Template JSON text.
+        """
+        return Path(template_path).read_text()
+
     def generate_simple_detection_workflow(self, output_path: Optional[str] = None) -> dict:
         """
         Generate a simple workflow that only detects AI content.
@@ -83,47 +140,9 @@ class WorkflowGenerator:
         Returns:
             Generated workflow as dictionary.
         """
-        workflow = {
-            "name": "Simple AI Detection",
-            "nodes": [
-                {
-                    "parameters": {"path": "detect-ai", "responseMode": "responseNode"},
-                    "id": "webhook",
-                    "name": "Webhook",
-                    "type": "n8n-nodes-base.webhook",
-                    "typeVersion": 1,
-                    "position": [250, 300],
-                },
-                {
-                    "parameters": {
-                        "method": "POST",
-                        "url": f"{self.api_base_url}/api/detect/text",
-                        "sendBody": true,
-                        "specifyBody": "json",
-                        "jsonBody": '={{ {"text": $json.text} }}',
-                    },
-                    "id": "detect",
-                    "name": "Detect AI",
-                    "type": "n8n-nodes-base.httpRequest",
-                    "typeVersion": 3,
-                    "position": [450, 300],
-                },
-                {
-                    "parameters": {"respondWith": "allIncomingItems"},
-                    "id": "respond",
-                    "name": "Respond",
-                    "type": "n8n-nodes-base.respondToWebhook",
-                    "typeVersion": 1,
-                    "position": [650, 300],
-                },
-            ],
-            "connections": {
-                "Webhook": {"main": [[{"node": "Detect AI", "type": "main", "index": 0}]]},
-                "Detect AI": {"main": [[{"node": "Respond", "type": "main", "index": 0}]]},
-            },
-            "active": false,
-            "settings": {},
-        }
+        # Substitute the JSON-escaped URL into the pre-serialized template
+        url = orjson.dumps(self.api_base_url).decode()[1:-1]
+        workflow = orjson.loads(_SIMPLE_WORKFLOW_JSON.replace(API_BASE_URL_PLACEHOLDER, url))
 
         if output_path:
             with open(output_path, "w") as f:
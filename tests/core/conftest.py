@@ -0,0 +1,64 @@
+"""Fixtures for core module tests."""
+
+import pytest
+import torch
+from tokenizers import Tokenizer, models, pre_tokenizers, processors
+from transformers import BertConfig, BertForSequenceClassification, PreTrainedTokenizerFast
+
+# Vocabulary of the tiny detector model; unknown words map to [UNK]
+TINY_VOCAB = ["[PAD]", "[UNK]", "[CLS]", "[SEP]"] + (
+    "the a an ai text is was were written generated by human model we they use "
+    "tools to win this that slide deck content report summary plan team"
+).split()
+
+
+@pytest.fixture(scope="session")
+def tiny_model_factory(tmp_path_factory):
+    """
+    Build tiny randomly initialized sequence classification models on disk.
+
+    Returns:
+        Function taking ``max_position_embeddings`` and returning the model directory.
+    """
+    model_dirs = {}
+
+    def build(max_position_embeddings: int = 64) -> str:
+        if max_position_embeddings in model_dirs:
+            return model_dirs[max_position_embeddings]
+
+        model_dir = tmp_path_factory.mktemp(f"tiny-model-{max_position_embeddings}")
+
+        tokenizer = Tokenizer(
+            models.WordLevel({word: i for i, word in enumerate(TINY_VOCAB)}, unk_token="[UNK]")
+        )
+        tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+        tokenizer.post_processor = processors.TemplateProcessing(
+            single="[CLS] $A [SEP]", special_tokens=[("[CLS]", 2), ("[SEP]", 3)]
+        )
+        PreTrainedTokenizerFast(
+            tokenizer_object=tokenizer,
+            unk_token="[UNK]",
+            pad_token="[PAD]",
+            cls_token="[CLS]",
+            sep_token="[SEP]",
+        ).save_pretrained(model_dir)
+
+        torch.manual_seed(7)
+        config = BertConfig(
+            vocab_size=len(TINY_VOCAB),
+            hidden_size=16,
+            num_hidden_layers=1,
+            num_attention_heads=2,
+            intermediate_size=32,
+            max_position_embeddings=max_position_embeddings,
+            num_labels=2,
+            # Large initial weights, so different texts land on both sides of 0.5
+            initializer_range=1.0,
+        )
+        model = BertForSequenceClassification(config)
+        model.save_pretrained(model_dir)
+
+        model_dirs[max_position_embeddings] = str(model_dir)
+        return model_dirs[max_position_embeddings]
+
+    return build
@@ -0,0 +1,187 @@
+"""Tests for the AI detector."""
+
+import threading
+
+import pytest
+import torch
+
+# Texts of varied content and length, so batches have several padded shapes
+TEXTS = [
+    "this text was written by a human team",
+    "the ai model generated this summary",
+    "we use tools to win",
+    "that slide deck is a plan " * 6,
+    "they were written by the ai " * 3,
+    "an report content the team",
+    "human " * 40,
+    "the ai text " * 40,
+]
+
+
+@pytest.fixture
+def detector_factory(mock_env, tiny_model_factory):
+    """Create AI detectors on a tiny model with the given position limit."""
+    from post_automation.core.ai_detector import AIDetector
+
+    def create(max_position_embeddings: int = 64) -> AIDetector:
+        return AIDetector(model_name=tiny_model_factory(max_position_embeddings))
+
+    return create
+
+
+def record_forward(detector) -> list[int]:
+    """Record the batch size of every forward pass the detector runs."""
+    batch_sizes: list[int] = []
+    forward = detector._forward
+
+    def recording_forward(inputs):
+        batch_sizes.append(inputs["input_ids"].shape[0])
+        return forward(inputs)
+
+    detector._forward = recording_forward
+    return batch_sizes
+
+
+def test_detect_serves_repeated_text_from_cache(detector_factory):
+    """Test repeated texts skip the model, including through detect_batch."""
+    detector = detector_factory()
+    batch_sizes = record_forward(detector)
+
+    result = detector.detect(TEXTS[0])
+
+    assert detector.detect(TEXTS[0]) is result
+    assert detector.detect(f"  {TEXTS[0]}\n") is result
+    assert detector.detect_batch([TEXTS[0]])[0] is result
+    assert batch_sizes == [1]
+
+
+def test_cache_evicts_least_recently_used(detector_factory):
+    """Test the cache drops the least recently used text once full."""
+    detector = detector_factory()
+    detector._cache_size = 2
+    batch_sizes = record_forward(detector)
+
+    detector.detect(TEXTS[0])
+    detector.detect(TEXTS[1])
+    detector.detect(TEXTS[0])
+    detector.detect(TEXTS[2])
+    assert len(batch_sizes) == 3
+
+    # TEXTS[1] was evicted, TEXTS[0] was kept by its recent use
+    detector.detect(TEXTS[0])
+    assert len(batch_sizes) == 3
+    detector.detect(TEXTS[1])
+    assert len(batch_sizes) == 4
+
+
+def test_detect_batch_splits_into_batches(detector_factory):
+    """Test detect_batch runs at most batch_size texts per forward pass."""
+    detector = detector_factory()
+    batch_sizes = record_forward(detector)
+
+    assert len(detector.detect_batch(TEXTS, batch_size=3)) == len(TEXTS)
+    assert batch_sizes == [3, 3, 2]
+
+
+def test_detect_batch_keeps_input_order(detector_factory):
+    """Test results line up with inputs across batches, cache hits, duplicates and empty texts."""
+    expected = {text: detector_factory().detect(text) for text in TEXTS}
+
+    detector = detector_factory()
+    detector.detect(TEXTS[1])
+    detector.detect(TEXTS[4])
+    batch_sizes = record_forward(detector)
+    texts = [
+        TEXTS[0],
+        "",
+        TEXTS[1],
+        TEXTS[0],
+        TEXTS[2],
+        "  ",
+        TEXTS[3],
+        TEXTS[4],
+        TEXTS[5],
+        TEXTS[2],
+        TEXTS[6],
+        TEXTS[7],
+    ]
+
+    results = detector.detect_batch(texts, batch_size=2)
+
+    # Only the six unique uncached texts go through the model
+    assert batch_sizes == [2, 2, 2]
+    assert len(results) == len(texts)
+    for text, result in zip(texts, results):
+        if not text.strip():
+            assert (result.label, result.confidence) == ("Human", 0.0)
+        else:
+            assert result.label == expected[text].label
+            assert result.confidence == pytest.approx(expected[text].confidence, abs=1e-5)
+
+
+def test_predict_batches_tokenizes_next_batch_during_forward(detector_factory):
+    """Test the next batch is tokenized in the background while the current one runs."""
+    detector = detector_factory()
+    batches = [TEXTS[0:3], TEXTS[3:6], TEXTS[6:]]
+    expected = [ai_probability for batch in batches for ai_probability in detector._predict(batch)]
+
+    tokenize, forward = detector._tokenize, detector._forward
+    tokenized = threading.Condition()
+    tokenize_threads: list[threading.Thread] = []
+    overlapped: list[bool] = []
+
+    def tracking_tokenize(texts):
+        with tokenized:
+            tokenize_threads.append(threading.current_thread())
+            tokenized.notify_all()
+        return tokenize(texts)
+
+    def waiting_forward(inputs):
+        # Every forward pass but the last should see the next batch being tokenized
+        passes = len(overlapped) + 1
+        if passes < len(batches):
+            with tokenized:
+                overlapped.append(
+                    tokenized.wait_for(lambda: len(tokenize_threads) > passes, timeout=5)
+                )
+        return forward(inputs)
+
+    detector._tokenize = tracking_tokenize
+    detector._forward = waiting_forward
+
+    ai_probabilities = detector._predict_batches(batches)
+
+    assert overlapped == [True, True]
+    assert threading.main_thread() not in tokenize_threads
+    assert ai_probabilities == pytest.approx(expected, abs=1e-5)
+
+
+@pytest.mark.skipif(not hasattr(torch, "compile"), reason="torch.compile is unavailable")
+def test_compiled_model_matches_eager(detector_factory):
+    """Test the compiled model gives the same results as eager mode across batch shapes."""
+    expected = detector_factory().detect_batch(TEXTS, batch_size=3)
+    assert {result.label for result in expected} == {"AI", "Human"}
+
+    detector = detector_factory()
+    detector._compile_model()
+    assert detector.compiled
+
+    results = detector.detect_batch(TEXTS, batch_size=3)
+
+    assert [result.label for result in results] == [result.label for result in expected]
+    assert [result.confidence for result in results] == pytest.approx(
+        [result.confidence for result in expected], abs=1e-5
+    )
+
+
+@pytest.mark.parametrize("max_position_embeddings", [60, 64])
+def test_inputs_fit_position_limit(detector_factory, max_position_embeddings):
+    """Test long inputs are truncated and padded within the model's position limit."""
+    detector = detector_factory(max_position_embeddings)
+    texts = ["the ai text " * 40, "we use tools"]
+
+    inputs = detector._tokenize(texts)
+
+    assert inputs["input_ids"].shape[1] <= max_position_embeddings
+    assert inputs["input_ids"].shape[1] % 8 == 0
+    assert len(detector.detect_batch(texts)) == 2
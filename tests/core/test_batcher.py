@@ -0,0 +1,178 @@
+"""Tests for dynamic batching of detection requests."""
+
+import asyncio
+import threading
+
+import pytest
+
+
+class StubDetector:
+    """Detector recording each batch and labelling texts containing "ai" as AI."""
+
+    def __init__(self, error=None, release=None):
+        self.batches = []
+        self.error = error
+        self.release = release
+        self.called = threading.Event()
+
+    def detect_batch(self, texts):
+        from post_automation.models.detection import DetectionResult
+
+        self.batches.append(list(texts))
+        self.called.set()
+        if self.release is not None:
+            self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+
+        return [
+            DetectionResult(
+                is_ai_generated="ai" in text,
+                confidence=1.0 if "ai" in text else 0.0,
+                label="AI" if "ai" in text else "Human",
+                model_name="stub",
+            )
+            for text in texts
+        ]
+
+
+@pytest.fixture
+def batcher_module(mock_env):
+    """Get the batcher module with a mocked environment."""
+    from post_automation.core import batcher
+
+    yield batcher
+    batcher._batcher_instance = None
+
+
+async def _submit_all(batcher, texts):
+    """Submit texts concurrently and gather their results or exceptions."""
+    return await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(text) for text in texts), return_exceptions=True), 5
+    )
+
+
+def test_full_batch_flushes_without_waiting(batcher_module):
+    """Test a batch is run as soon as it reaches the maximum size."""
+    detector = StubDetector()
+    batcher = batcher_module.AsyncBatcher(detector, max_batch_size=3, max_wait_ms=60_000)
+
+    async def run():
+        results = await _submit_all(batcher, ["ai one", "human two", "ai three"])
+        await batcher.close()
+        return results
+
+    results = asyncio.run(run())
+
+    assert detector.batches == [["ai one", "human two", "ai three"]]
+    assert [result.label for result in results] == ["AI", "Human", "AI"]
+
+
+def test_partial_batch_flushes_after_timeout(batcher_module):
+    """Test a batch that never fills is run once the wait time runs out."""
+    detector = StubDetector()
+    batcher = batcher_module.AsyncBatcher(detector, max_batch_size=10, max_wait_ms=20)
+
+    async def run():
+        results = await _submit_all(batcher, ["ai one", "human two"])
+        later = await _submit_all(batcher, ["ai three"])
+        await batcher.close()
+        return results + later
+
+    results = asyncio.run(run())
+
+    assert detector.batches == [["ai one", "human two"], ["ai three"]]
+    assert [result.label for result in results] == ["AI", "Human", "AI"]
+
+
+def test_detector_error_reaches_every_waiter(batcher_module):
+    """Test a failing batch raises the detector's exception in every caller."""
+    error = ValueError("model failed")
+    batcher = batcher_module.AsyncBatcher(
+        StubDetector(error=error), max_batch_size=3, max_wait_ms=60_000
+    )
+
+    async def run():
+        results = await _submit_all(batcher, ["one", "two", "three"])
+        await batcher.close()
+        return results
+
+    assert asyncio.run(run()) == [error, error, error]
+
+
+def test_close_batcher_cancels_in_flight_requests(batcher_module):
+    """Test close_batcher stops the worker, cancels waiters and drops the instance."""
+    release = threading.Event()
+    detector = StubDetector(release=release)
+
+    async def run():
+        batcher = batcher_module.get_batcher(detector)
+        assert batcher_module.get_batcher(detector) is batcher
+
+        request = asyncio.ensure_future(batcher.submit("ai text"))
+        await asyncio.to_thread(detector.called.wait, 5)
+        worker = batcher._worker
+
+        await batcher_module.close_batcher()
+        release.set()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(request, 5)
+        return worker
+
+    worker = asyncio.run(run())
+
+    assert worker.cancelled()
+    assert batcher_module._batcher_instance is None
+
+
+def test_worker_restarts_without_losing_queued_requests(batcher_module):
+    """Test requests queued while the worker is stopped are run by the restarted worker."""
+    detector = StubDetector()
+    batcher = batcher_module.AsyncBatcher(detector, max_batch_size=2, max_wait_ms=20)
+
+    async def run():
+        batcher._ensure_worker()
+        batcher._worker.cancel()
+        await asyncio.sleep(0)
+
+        queued = asyncio.get_running_loop().create_future()
+        await batcher._queue.put(("ai queued", queued))
+
+        results = await _submit_all(batcher, ["human next"])
+        result = await asyncio.wait_for(queued, 5)
+        await batcher.close()
+        return [result] + results
+
+    results = asyncio.run(run())
+
+    assert detector.batches == [["ai queued", "human next"]]
+    assert [result.label for result in results] == ["AI", "Human"]
+
+
+def test_requests_left_on_a_previous_loop_fail(batcher_module):
+    """Test moving to a new event loop fails requests stranded on the old one."""
+    detector = StubDetector()
+    batcher = batcher_module.AsyncBatcher(detector, max_batch_size=2, max_wait_ms=20)
+
+    async def strand():
+        batcher._ensure_worker()
+        batcher._worker.cancel()
+        await asyncio.sleep(0)
+
+        stranded = asyncio.get_running_loop().create_future()
+        batcher._queue.put_nowait(("ai stranded", stranded))
+        return stranded
+
+    stranded = asyncio.run(strand())
+
+    async def run():
+        results = await _submit_all(batcher, ["human next"])
+        await batcher.close()
+        return results
+
+    results = asyncio.run(run())
+
+    assert isinstance(stranded.exception(), RuntimeError)
+    assert detector.batches == [["human next"]]
+    assert [result.label for result in results] == ["Human"]
@@ -0,0 +1,82 @@
+"""Tests for rule-based content generation."""
+
+import re
+import sys
+
+import pytest
+
+# Texts mixing ASCII and Unicode case variants, overlapping phrases and multi-byte text
+PARITY_TEXTS = [
+    "",
+    "We utilize tools in order to win.",
+    "UTİLİZE this",
+    "utılıze that, then UTILIZE more",
+    "ſubsequent to lunch, prior to dinner",
+    "We must maKe a decision",
+    "Café résumé: in the event that we are able to, we will",
+    "Subsequent To the meeting, it is being handled in the near future",
+    "very very good, that that is all",
+]
+
+
+@pytest.fixture
+def regex_generator(mock_env):
+    """Create a content generator that uses the regex implementation."""
+    from post_automation.core.content_generator import ContentGenerator
+
+    generator = ContentGenerator()
+    generator._hs_database = None
+    return generator
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("We utilize tools in order to win.", "We use tools to win."),
+        ("UTILIZE it Prior To launch", "use it before launch"),
+        ("UTİLİZE this", "use this"),
+        ("utılıze that", "use that"),
+        ("ſubsequent to lunch", "after lunch"),
+        ("We must maKe a decision", "We must decide"),
+        ("Nothing to replace", "Nothing to replace"),
+    ],
+)
+def test_generate_replaces_case_variants(regex_generator, text, expected):
+    """Test every case-insensitive match of a phrase gets its replacement."""
+    assert regex_generator.generate(text) == expected
+
+
+@pytest.fixture
+def hyperscan_generator(mock_env):
+    """Create a content generator that uses the Hyperscan implementation."""
+    pytest.importorskip("hyperscan")
+    from post_automation.core.content_generator import ContentGenerator
+
+    generator = ContentGenerator()
+    assert generator._hs_database is not None
+    return generator
+
+
+@pytest.mark.parametrize("text", PARITY_TEXTS)
+def test_hyperscan_matches_regex(regex_generator, hyperscan_generator, text):
+    """Test the Hyperscan and regex paths rewrite texts identically."""
+    assert hyperscan_generator.generate(text) == regex_generator.generate(text)
+
+
+def test_generate_batch_matches_generate(regex_generator, hyperscan_generator):
+    """Test batch generation keeps order and agrees with the regex path."""
+    expected = [regex_generator.generate(text) for text in PARITY_TEXTS]
+
+    assert hyperscan_generator.generate_batch(PARITY_TEXTS) == expected
+
+
+def test_unicode_case_variants_are_complete(mock_env):
+    """Test the regex-only characters are every non-ASCII case variant of an ASCII letter."""
+    from post_automation.core.content_generator import _UNICODE_CASE_VARIANTS
+
+    letters = re.compile("[a-z]", re.IGNORECASE)
+    variants = {
+        chr(cp) for cp in range(0x80, sys.maxunicode + 1) if letters.fullmatch(chr(cp))
+    }
+
+    assert variants == set(_UNICODE_CASE_VARIANTS.pattern[1:-1])
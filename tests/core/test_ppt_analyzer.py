@@ -0,0 +1,78 @@
+"""Tests for PowerPoint text extraction."""
+
+import pytest
+from pptx import Presentation
+from pptx.util import Inches
+
+
+@pytest.fixture
+def analyzer(mock_env):
+    """Create an analyzer with a mocked environment."""
+    from post_automation.core.ppt_analyzer import PPTAnalyzer
+
+    return PPTAnalyzer()
+
+
+@pytest.fixture
+def deck_path(tmp_path):
+    """Build a deck covering text frames, tables, groups and an empty slide."""
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+
+    slide = prs.slides.add_slide(layout)
+    text_frame = slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(2)).text_frame
+    text_frame.text = "  Title line  "
+    text_frame.add_paragraph().text = ""
+    paragraph = text_frame.add_paragraph()
+    paragraph.add_run().text = "Split "
+    paragraph.add_line_break()
+    paragraph.add_run().text = "run"
+
+    slide = prs.slides.add_slide(layout)
+    table = slide.shapes.add_table(2, 2, Inches(1), Inches(1), Inches(4), Inches(2)).table
+    cell_frame = table.cell(0, 0).text_frame
+    cell_frame.text = " First paragraph "
+    cell_frame.add_paragraph().text = ""
+    cell_frame.add_paragraph().text = "Third paragraph  "
+    table.cell(0, 1).text = "Single"
+    table.cell(1, 0).text = "   "
+    slide.shapes.add_textbox(Inches(1), Inches(4), Inches(4), Inches(1)).text = "After table"
+
+    slide = prs.slides.add_slide(layout)
+    group = slide.shapes.add_group_shape()
+    group.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1)).text = "Grouped"
+    group.shapes.add_textbox(Inches(3), Inches(1), Inches(2), Inches(1)).text = "Shapes"
+
+    prs.slides.add_slide(layout)
+
+    path = tmp_path / "deck.pptx"
+    prs.save(path)
+    return str(path)
+
+
+def test_extract_text_fast_matches_object_model(analyzer, deck_path):
+    """Test the streaming extractor returns the same slides as the python-pptx path."""
+    fast = analyzer.extract_text_fast(deck_path)
+    slow = analyzer.extract_text_from_pptx(deck_path)
+
+    assert [slide.model_dump() for slide in fast] == [slide.model_dump() for slide in slow]
+
+
+def test_extract_text_fast_joins_cell_paragraphs_with_newlines(analyzer, deck_path):
+    """Test table cell paragraphs are joined like python-pptx's cell.text."""
+    slides = analyzer.extract_text_fast(deck_path)
+
+    assert slides[1].text == "First paragraph \n\nThird paragraph Single After table"
+
+
+def test_extract_text_from_bytes_and_file_objects(analyzer, deck_path):
+    """Test in-memory content and file objects give the same slides as a path."""
+    expected = analyzer.extract_text_from_pptx(deck_path)
+
+    with open(deck_path, "rb") as f:
+        data = f.read()
+        f.seek(0)
+        from_file = analyzer.extract_text_from_pptx(f)
+
+    assert analyzer.extract_text_from_bytes(data, "deck.pptx") == expected
+    assert from_file == expected
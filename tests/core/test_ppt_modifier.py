@@ -0,0 +1,230 @@
+"""Tests for the PowerPoint modifier."""
+
+import io
+import zipfile
+
+import pytest
+from pptx import Presentation
+from pptx.dml.color import RGBColor
+from pptx.util import Inches, Pt
+
+# Slide part names in presentation order once the deck is reordered
+REORDERED_PARTS = ["ppt/slides/slide3.xml", "ppt/slides/slide1.xml", "ppt/slides/slide2.xml"]
+
+
+@pytest.fixture
+def modifier_cls(mock_env):
+    """Get the modifier class with a mocked environment."""
+    from post_automation.core.ppt_modifier import PPTModifier
+
+    return PPTModifier
+
+
+@pytest.fixture
+def deck_bytes():
+    """Build a three-slide deck with a table, its last slide moved to the front."""
+    prs = Presentation()
+    layout = prs.slide_layouts[6]
+
+    slide = prs.slides.add_slide(layout)
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text = "Alpha text"
+
+    slide = prs.slides.add_slide(layout)
+    table = slide.shapes.add_table(2, 2, Inches(1), Inches(1), Inches(4), Inches(2)).table
+    table.cell(0, 0).text = "Beta cell"
+    table.cell(1, 1).text = "Beta footer"
+
+    slide = prs.slides.add_slide(layout)
+    slide.shapes.add_textbox(Inches(1), Inches(1), Inches(4), Inches(1)).text = "Gamma text"
+
+    # Reorder sldIdLst only, so slide part names no longer follow presentation order
+    sld_id_lst = prs.slides._sldIdLst
+    sld_id_lst.insert(0, sld_id_lst[-1])
+
+    buffer = io.BytesIO()
+    prs.save(buffer)
+    return buffer.getvalue()
+
+
+def _slide_runs(slide):
+    """Get every text run of a slide, including runs in table cells."""
+    for shape in slide.shapes:
+        if shape.has_table:
+            text_frames = [cell.text_frame for row in shape.table.rows for cell in row.cells]
+        elif shape.has_text_frame:
+            text_frames = [shape.text_frame]
+        else:
+            continue
+
+        for text_frame in text_frames:
+            for paragraph in text_frame.paragraphs:
+                yield from paragraph.runs
+
+
+def _slide_text(slide):
+    """Get the concatenated run text of a slide."""
+    return " ".join(run.text for run in _slide_runs(slide))
+
+
+def _entries(data):
+    """Read every zip entry of a package."""
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        return {info.filename: archive.read(info) for info in archive.infolist()}
+
+
+def test_deck_is_reordered(mock_env, deck_bytes):
+    """Test the fixture deck's slide parts are out of presentation order."""
+    from post_automation.core.ppt_analyzer import get_slide_part_names
+
+    with zipfile.ZipFile(io.BytesIO(deck_bytes)) as archive:
+        assert get_slide_part_names(archive) == REORDERED_PARTS
+
+
+def test_save_incremental_rewrites_only_changed_slides(modifier_cls, deck_bytes):
+    """Test replacements land in the right slide parts and other parts are copied."""
+    from post_automation.models.ppt import ReplacementT
+
+    modifier = modifier_cls.from_bytes(deck_bytes)
+    modifier.apply(
+        [
+            ReplacementT(0, "Gamma", "Omega"),
+            ReplacementT(2, "Beta cell", "Revised cell"),
+        ]
+    )
+
+    output = io.BytesIO()
+    modifier.save_incremental(output)
+
+    slides = list(Presentation(io.BytesIO(output.getvalue())).slides)
+    assert [_slide_text(slide) for slide in slides] == [
+        "Omega text",
+        "Alpha text",
+        "Revised cell Beta footer",
+    ]
+
+    source_entries = _entries(deck_bytes)
+    output_entries = _entries(output.getvalue())
+    assert list(output_entries) == list(source_entries)
+
+    rewritten = {REORDERED_PARTS[0], REORDERED_PARTS[2]}
+    for name, data in source_entries.items():
+        if name in rewritten:
+            assert output_entries[name] != data
+        else:
+            assert output_entries[name] == data, name
+
+
+def test_save_incremental_with_styles(modifier_cls, deck_bytes):
+    """Test styles reach every run, table cells included, and non-slide parts are copied."""
+    from post_automation.models.ppt import ColorScheme, Replacement, StyleConfig
+
+    modifier = modifier_cls.from_bytes(deck_bytes)
+    modifier.apply(
+        [Replacement(slide_num=1, old_text="Alpha", new_text="First")],
+        StyleConfig(
+            font_name="Arial", font_size=20, color_scheme=ColorScheme(text_color="#112233")
+        ),
+    )
+
+    output = io.BytesIO()
+    modifier.save_incremental(output)
+
+    slides = list(Presentation(io.BytesIO(output.getvalue())).slides)
+    assert _slide_text(slides[1]) == "First text"
+
+    runs = [run for slide in slides for run in _slide_runs(slide)]
+    assert len(runs) == 4
+    for run in runs:
+        assert run.font.name == "Arial"
+        assert run.font.size == Pt(20)
+        assert run.font.color.rgb == RGBColor(0x11, 0x22, 0x33)
+
+    source_entries = _entries(deck_bytes)
+    output_entries = _entries(output.getvalue())
+    for name, data in source_entries.items():
+        if name not in REORDERED_PARTS:
+            assert output_entries[name] == data, name
+
+
+# (pairs, text, expected) cases with at least AHO_CORASICK_MIN_PATTERNS distinct keys
+REPLACER_CASES = [
+    pytest.param(
+        [("ab", "X"), ("abc", "Y"), ("bcd", "Z"), ("ab", "W"), ("d", "D")],
+        "abcd abd xabcdx",
+        "YD XD xYDx",
+        id="overlapping",
+    ),
+    pytest.param(
+        [("cat", "dog"), ("cat", "bird"), ("at", "ot"), ("c", "k"), ("at", "it"), ("s", "z")],
+        "cats at c",
+        "dogz ot k",
+        id="duplicates",
+    ),
+    pytest.param(
+        [("a", "1"), ("ab", "2"), ("abc", "3"), ("b", "4")],
+        "abcab ba",
+        "32 41",
+        id="nested-prefixes",
+    ),
+    pytest.param(
+        [("a", "b"), ("b", "a"), ("c", "cc"), ("x", "")],
+        "abcx",
+        "bacc",
+        id="no-rescan",
+    ),
+    pytest.param(
+        [("", "Z"), ("foo", "bar"), ("o", "0"), ("fo", "F"), ("f", "ph")],
+        "foo fo o f",
+        "bar F 0 ph",
+        id="empty-key",
+    ),
+]
+
+
+@pytest.fixture
+def modifier_module(mock_env):
+    """Get the modifier module with a mocked environment."""
+    from post_automation.core import ppt_modifier
+
+    return ppt_modifier
+
+
+@pytest.fixture(params=["regex", "automaton"])
+def replacer_kind(request, modifier_module, monkeypatch):
+    """Select the multi-pattern replacement path _build_replacer takes."""
+    if request.param == "automaton":
+        pytest.importorskip("ahocorasick")
+    else:
+        monkeypatch.setattr(modifier_module, "ahocorasick", None)
+
+    return request.param
+
+
+@pytest.mark.parametrize("pairs, text, expected", REPLACER_CASES)
+def test_replacer_leftmost_longest_first_wins(
+    modifier_module, replacer_kind, pairs, text, expected
+):
+    """Test the regex and automaton paths agree on leftmost-longest, first-wins results."""
+    replacer = modifier_module.PPTModifier._build_replacer(pairs)
+
+    if replacer_kind == "automaton":
+        assert replacer.func == modifier_module.PPTModifier._replace_with_automaton
+    else:
+        assert replacer.func.__name__ == "sub"
+    assert replacer(text) == expected
+
+
+@pytest.mark.parametrize(
+    "old_text, new_text, text",
+    [("aa", "b", "aaaaa"), ("ab", "", "abab a b"), ("x", "xx", "xyx"), ("q", "Q", "none")],
+)
+def test_single_replacement_matches_automaton(modifier_module, old_text, new_text, text):
+    """Test the str.replace path agrees with the automaton for a single pattern."""
+    pytest.importorskip("ahocorasick")
+    cls = modifier_module.PPTModifier
+
+    replaced = cls._build_replacer([(old_text, new_text)])(text)
+
+    assert replaced == text.replace(old_text, new_text)
+    automaton = cls._build_automaton({old_text: new_text})
+    assert cls._replace_with_automaton(text, automaton) == replaced
@@ -0,0 +1,56 @@
+"""Tests for file handling utilities."""
+
+import asyncio
+import os
+import stat
+
+import pytest
+
+
+class FakeUpload:
+    """Upload with an async read(size) method serving ``total`` bytes."""
+
+    def __init__(self, total: int, byte: bytes = b"x"):
+        self.remaining = total
+        self.byte = byte
+
+    async def read(self, size: int) -> bytes:
+        chunk_size = min(size, self.remaining)
+        self.remaining -= chunk_size
+        return self.byte * chunk_size
+
+
+@pytest.fixture
+def file_handler(mock_env):
+    """Get the file handler module with a mocked environment."""
+    from post_automation.utils import file_handler
+
+    return file_handler
+
+
+def test_save_upload_stream_writes_owner_only_file(file_handler, tmp_path):
+    """Test the upload is saved in full and readable only by its owner."""
+    size = file_handler.UPLOAD_CHUNK_SIZE * 2 + 123
+
+    path, total = asyncio.run(
+        file_handler.save_upload_stream(FakeUpload(size), "deck.pptx", str(tmp_path))
+    )
+
+    assert total == size
+    assert path.endswith(".pptx")
+    assert os.path.dirname(path) == str(tmp_path)
+    assert os.path.getsize(path) == size
+    assert stat.S_IMODE(os.stat(path).st_mode) == 0o600
+
+
+def test_save_upload_stream_removes_oversized_upload(file_handler, tmp_path):
+    """Test an upload over the size limit is rejected and its partial file removed."""
+    from post_automation.utils.config import SETTINGS
+    from post_automation.utils.validators import ValidationError
+
+    upload = FakeUpload(SETTINGS.max_upload_size_bytes + 1, b"\0")
+
+    with pytest.raises(ValidationError):
+        asyncio.run(file_handler.save_upload_stream(upload, "deck.pptx", str(tmp_path)))
+
+    assert list(tmp_path.iterdir()) == []
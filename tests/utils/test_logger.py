@@ -0,0 +1,87 @@
+"""Tests for logging configuration."""
+
+import logging
+import sys
+
+import orjson
+import pytest
+
+
+@pytest.fixture
+def logger_module(mock_env):
+    """Get the logger module with a mocked environment."""
+    from post_automation.utils import logger
+
+    return logger
+
+
+@pytest.fixture
+def fresh_logger_name(request):
+    """Get a logger name unique to the test, removing its handlers afterwards."""
+    name = f"post_automation_test.{request.node.name}"
+    yield name
+
+    for logger_name in (name, f"{name}.child"):
+        logger = logging.getLogger(logger_name)
+        logger.handlers.clear()
+        logger.propagate = True
+
+
+def default_handlers(logger: logging.Logger) -> list[logging.Handler]:
+    """Get the handlers setup_logger attached to a logger."""
+    from post_automation.utils.logger import HANDLER_NAME
+
+    return [handler for handler in logger.handlers if handler.get_name() == HANDLER_NAME]
+
+
+def test_setup_logger_attaches_one_handler(logger_module, fresh_logger_name):
+    """Test repeated setup_logger calls attach a single handler, even with a cleared cache."""
+    for _ in range(3):
+        logger = logger_module.setup_logger(fresh_logger_name)
+    logger_module.setup_logger.cache_clear()
+    for _ in range(3):
+        logger = logger_module.setup_logger(fresh_logger_name)
+
+    assert len(default_handlers(logger)) == 1
+
+
+def test_setup_logger_reuses_parent_handler(logger_module, fresh_logger_name):
+    """Test child loggers rely on their parent's handler unless they stop propagating."""
+    logger_module.setup_logger(fresh_logger_name)
+    child_name = f"{fresh_logger_name}.child"
+
+    assert default_handlers(logger_module.setup_logger(child_name)) == []
+
+    logging.getLogger(child_name).propagate = False
+    logger_module.setup_logger.cache_clear()
+    assert len(default_handlers(logger_module.setup_logger(child_name))) == 1
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        'quoted "text" and \'single\' quotes',
+        "first line\nsecond line\r\n",
+        "tab\tbackslash\\ and control \x1f",
+        "unicode 中文 ✓",
+    ],
+)
+def test_json_formatter_output_parses(logger_module, message):
+    """Test JsonFormatter emits one parsable JSON line per record."""
+    try:
+        raise ValueError(f"failed on {message}")
+    except ValueError:
+        exc_info = sys.exc_info()
+    record = logging.LogRecord(
+        "post_automation.test", logging.ERROR, __file__, 1, "%s", (message,), exc_info
+    )
+
+    output = logger_module.JsonFormatter().format(record)
+    entry = orjson.loads(output)
+
+    assert "\n" not in output
+    assert entry["message"] == message
+    assert entry["level"] == "ERROR"
+    assert entry["logger"] == "post_automation.test"
+    assert entry["exception"].startswith("Traceback")
+    assert entry["exception"].endswith(f"ValueError: failed on {message}")
@@ -0,0 +1,52 @@
+"""Tests for input validators."""
+
+import pytest
+
+STRIP_CASES = [
+    "",
+    " ",
+    " \t\n\r\x0b\x0c",
+    "\u3000\u3000",
+    "\x1c\x1d\x1e\x1f",
+    "\x85\xa0 ",
+    "visible text",
+    "visible\u3000inner\x1fwhitespace",
+    "  leading",
+    "trailing\n\n",
+    "\u3000full-width padding\u3000",
+    "\x1csepara\x1ftors\x1e",
+    " \x1f\u3000mixed\t\x1c ",
+    "x",
+    " x ",
+]
+
+
+@pytest.fixture
+def validators(mock_env):
+    """Get the validators module with a mocked environment."""
+    from post_automation.utils import validators
+
+    return validators
+
+
+@pytest.mark.parametrize("text", STRIP_CASES)
+def test_stripped_len_matches_strip(validators, text):
+    """Test _stripped_len agrees with len(text.strip())."""
+    assert validators._stripped_len(text) == len(text.strip())
+
+
+@pytest.mark.parametrize("text", STRIP_CASES)
+def test_validate_text_input_measures_stripped_text(validators, text):
+    """Test the fast path and the stripping path both measure the stripped text."""
+    length = len(text.strip())
+
+    if not length:
+        with pytest.raises(validators.ValidationError, match="empty"):
+            validators.validate_text_input(text, min_length=0)
+        return
+
+    validators.validate_text_input(text, min_length=length, max_length=length)
+    with pytest.raises(validators.ValidationError, match="at least"):
+        validators.validate_text_input(text, min_length=length + 1)
+    with pytest.raises(validators.ValidationError, match="must not exceed"):
+        validators.validate_text_input(text, min_length=0, max_length=length - 1)
@@ -0,0 +1,79 @@
+"""Tests for the n8n workflow generator."""
+
+import json
+
+import pytest
+
+BASE_URL = 'http://api.example.com:8000/a"b\\c'
+
+
+@pytest.fixture
+def generator_cls(mock_env):
+    """Get the workflow generator class with a mocked environment."""
+    from post_automation.workflows.generator import WorkflowGenerator
+
+    return WorkflowGenerator
+
+
+def _node(workflow, name):
+    """Get a workflow node by name."""
+    return next(node for node in workflow["nodes"] if node["name"] == name)
+
+
+def _query_params(node):
+    """Get a node's query parameters as a name to value mapping."""
+    params = node["parameters"]["options"]["queryParameters"]["parameters"]
+    return {param["name"]: param["value"] for param in params}
+
+
+def test_simple_detection_workflow(generator_cls):
+    """Test the simple workflow builds with an escaped base URL and real booleans."""
+    workflow = generator_cls(api_base_url=BASE_URL).generate_simple_detection_workflow()
+
+    params = _node(workflow, "Detect AI")["parameters"]
+    assert params["url"] == f"{BASE_URL}/api/detect/text"
+    assert params["sendBody"] is True
+    assert workflow["active"] is False
+
+
+def test_simple_detection_workflow_saves_file(generator_cls, tmp_path):
+    """Test the simple workflow is written to the output path."""
+    output_path = tmp_path / "simple.json"
+    workflow = generator_cls(api_base_url=BASE_URL).generate_simple_detection_workflow(
+        str(output_path)
+    )
+
+    assert json.loads(output_path.read_text()) == workflow
+
+
+def test_generate_workflow_substitutes_url_and_threshold(generator_cls):
+    """Test API URLs and the confidence threshold are filled into the template."""
+    workflow = generator_cls(api_base_url=BASE_URL).generate_workflow(confidence_threshold=0.55)
+
+    assert _node(workflow, "Detect AI Content")["parameters"]["url"] == (
+        f"{BASE_URL}/api/detect/pptx"
+    )
+
+    modify = _node(workflow, "Modify Presentation")
+    assert modify["parameters"]["url"] == f"{BASE_URL}/api/modify/pptx"
+    assert _query_params(modify) == {"replace_ai_content": "true", "confidence_threshold": "0.55"}
+
+    assert workflow["active"] is False
+    assert "$env.API_BASE_URL" not in json.dumps(workflow)
+
+
+def test_generate_workflow_default_threshold(generator_cls):
+    """Test the default confidence threshold is used when none is given."""
+    workflow = generator_cls().generate_workflow()
+
+    modify = _node(workflow, "Modify Presentation")
+    assert modify["parameters"]["url"] == "http://localhost:8000/api/modify/pptx"
+    assert _query_params(modify)["confidence_threshold"] == "0.7"
+
+
+def test_generate_workflow_saves_file(generator_cls, tmp_path):
+    """Test the generated workflow is written to the output path."""
+    output_path = tmp_path / "nested" / "workflow.json"
+    workflow = generator_cls(api_base_url=BASE_URL).generate_workflow(str(output_path))
+
+    assert json.loads(output_path.read_text()) == workflow